@@ -19,11 +19,18 @@ import argparse
 import json
 import csv
 import logging
+import logging.handlers
+import atexit
 import smtplib
+import socket
 import ssl
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -33,10 +40,15 @@ from email.mime.application import MIMEApplication
 from email import encoders
 import mimetypes
 import re
+import copy
+import functools
+from contextlib import contextmanager
+import hashlib
+from operator import itemgetter
 
 # Third-party imports
 try:
-    from jinja2 import Template, Environment, FileSystemLoader, TemplateNotFound
+    from jinja2 import Template, Environment, FileSystemLoader, FileSystemBytecodeCache, TemplateNotFound
     JINJA2_AVAILABLE = True
 except ImportError:
     print("Warning: Jinja2 not available. Template functionality will be limited.")
@@ -44,8 +56,23 @@ except ImportError:
     Template = None
     Environment = None
     FileSystemLoader = None
+    FileSystemBytecodeCache = None
     TemplateNotFound = Exception
 
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+    aiosmtplib = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 
 class EmailAppError(Exception):
     """Base exception for email application errors."""
@@ -62,6 +89,11 @@ class EmailSendError(EmailAppError):
     pass
 
 
+class SMTPConnectionError(EmailSendError):
+    """Exception for failures to reach the SMTP server that may clear up on retry."""
+    pass
+
+
 class TemplateError(EmailAppError):
     """Exception for template-related errors."""
     pass
@@ -72,6 +104,24 @@ class CSVError(EmailAppError):
     pass
 
 
+class CSVFileUnavailableError(CSVError):
+    """Exception for a CSV file that is missing or locked, e.g. while being saved."""
+    pass
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once its oldest buffered record is flush_interval seconds old."""
+    
+    def __init__(self, capacity: int, flush_interval: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush when full, on a severe record, or when the buffer is getting stale."""
+        return (super().shouldFlush(record) or
+                record.created - self.buffer[0].created >= self.flush_interval)
+
+
 class Logger:
     """
     Centralized logging system for the email application.
@@ -80,6 +130,11 @@ class Logger:
     specific methods for different types of operations.
     """
     
+    # Records buffered before the log file is written; kept small, and
+    # time-limited, so a tailed or post-crash log file lags only slightly
+    FILE_BUFFER_CAPACITY = 32
+    FILE_FLUSH_INTERVAL = 1.0
+    
     def __init__(self, log_file: str = "email_app.log", log_level: str = "INFO"):
         """
         Initialize the logger.
@@ -94,8 +149,15 @@ class Logger:
         self._setup_logging()
     
     def _setup_logging(self) -> None:
-        """Configure logging with both file and console handlers."""
-        # Clear existing handlers
+        """
+        Configure logging with both file and console handlers.
+        
+        The handlers run on a QueueListener thread; callers only enqueue the
+        record, so sending is never blocked on formatting or disk writes.
+        """
+        # Stop listeners left behind by an earlier Logger, then clear handlers
+        for handler in self.logger.handlers:
+            self._stop_listener(handler)
         self.logger.handlers.clear()
         self.logger.setLevel(self.log_level)
         
@@ -110,6 +172,8 @@ class Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
+        handlers = []
+        
         # File handler
         try:
             log_path = Path(self.log_file)
@@ -118,7 +182,16 @@ class Logger:
             file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
             file_handler.setLevel(self.log_level)
             file_handler.setFormatter(detailed_formatter)
-            self.logger.addHandler(file_handler)
+            
+            # Batch file writes; errors and shutdown flush immediately
+            buffered_handler = TimedMemoryHandler(
+                self.FILE_BUFFER_CAPACITY,
+                self.FILE_FLUSH_INTERVAL,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            buffered_handler.setLevel(self.log_level)
+            handlers.append(buffered_handler)
         except Exception as e:
             print(f"Warning: Could not create log file {self.log_file}: {e}")
         
@@ -126,10 +199,39 @@ class Logger:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(simple_formatter)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
+        
+        # Hand records to the real handlers on a background thread
+        log_queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._queue_handler.listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.logger.addHandler(self._queue_handler)
+        self._queue_handler.listener.start()
         
         self.info(f"Logging initialized - File: {self.log_file}")
     
+    def close(self) -> None:
+        """Flush queued and buffered records and stop the logging thread."""
+        self._stop_listener(self._queue_handler)
+    
+    @classmethod
+    def _shutdown(cls) -> None:
+        """Flush and stop whichever listener is running when the process exits."""
+        for handler in logging.getLogger('email_app').handlers:
+            cls._stop_listener(handler)
+    
+    @staticmethod
+    def _stop_listener(handler: logging.Handler) -> None:
+        """Stop the QueueListener attached to a handler, if still running."""
+        listener = getattr(handler, 'listener', None)
+        if listener is not None:
+            handler.listener = None
+            listener.stop()
+            for target in listener.handlers:
+                target.flush()
+    
     def debug(self, message: str) -> None:
         """Log debug message."""
         self.logger.debug(message)
@@ -150,26 +252,41 @@ class Logger:
         """Log critical message."""
         self.logger.critical(message)
     
+    # The log_* helpers below are called per recipient, so they pass lazy
+    # %-style arguments and skip formatting entirely when the level is filtered.
+    
+    def log_email_sending(self, recipient: str) -> None:
+        """Log that a bulk email is about to be sent."""
+        self.logger.info("Sending email to: %s", recipient)
+    
     def log_email_success(self, recipient: str, subject: str, attachments: int = 0) -> None:
         """Log successful email send."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         attachment_info = f" with {attachments} attachment(s)" if attachments else ""
-        self.info(f"EMAIL SENT ✓ - To: {recipient} - Subject: '{subject}'{attachment_info}")
+        self.logger.info("EMAIL SENT ✓ - To: %s - Subject: '%s'%s", recipient, subject, attachment_info)
     
     def log_email_failure(self, recipient: str, error: str, subject: str = None) -> None:
         """Log failed email send."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         subject_info = f" - Subject: '{subject}'" if subject else ""
-        self.error(f"EMAIL FAILED ✗ - To: {recipient}{subject_info} - Error: {error}")
+        self.logger.error("EMAIL FAILED ✗ - To: %s%s - Error: %s", recipient, subject_info, error)
     
     def log_smtp_connection(self, host: str, port: int, username: str) -> None:
         """Log SMTP connection attempt."""
-        self.info(f"SMTP CONNECT - {host}:{port} - User: {username}")
+        self.logger.info("SMTP CONNECT - %s:%s - User: %s", host, port, username)
     
     def log_test_result(self, success: bool, recipient: str, error: str = None) -> None:
         """Log test email result."""
         if success:
-            self.info(f"TEST EMAIL ✓ - Sent to: {recipient}")
+            self.logger.info("TEST EMAIL ✓ - Sent to: %s", recipient)
         else:
-            self.error(f"TEST EMAIL ✗ - Failed to: {recipient} - Error: {error}")
+            self.logger.error("TEST EMAIL ✗ - Failed to: %s - Error: %s", recipient, error)
+
+
+# A single exit hook covers every Logger, since each one replaces the last listener
+atexit.register(Logger._shutdown)
 
 
 class ConfigurationManager:
@@ -193,6 +310,7 @@ class ConfigurationManager:
         },
         'files': {
             'csv_recipients': 'recipients.csv',
+            'csv_delimiter': None,
             'email_template': 'template.txt',
             'output_directory': './output',
             'log_directory': './logs'
@@ -208,10 +326,14 @@ class ConfigurationManager:
             'max_attachments': 10,
             'max_file_size_mb': 25,
             'batch_size': 100,
+            'concurrency': 1,
+            'rate_limits': {},
             'template_directory': './templates'
         }
     }
     
+    REQUIRED_SMTP_FIELDS = ('server', 'username', 'password')
+    
     def __init__(self, logger: Logger):
         """
         Initialize configuration manager.
@@ -236,19 +358,18 @@ class ConfigurationManager:
         Raises:
             ConfigurationError: If configuration is invalid
         """
-        if not os.path.exists(config_file):
-            raise ConfigurationError(f"Configuration file not found: {config_file}")
-        
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ConfigurationError(f"Invalid JSON in {config_file}: {e}")
-        except Exception as e:
-            raise ConfigurationError(f"Error reading {config_file}: {e}")
+            stat = os.stat(config_file)
+        except OSError:
+            raise ConfigurationError(f"Configuration file not found: {config_file}")
         
-        # Merge with defaults
-        self.config = self._merge_config(self.DEFAULT_CONFIG, user_config)
+        # Reloading an unchanged file reuses the parsed and merged result;
+        # each section is copied so this instance can modify its own config
+        merged = self._load_merged(os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+        self.config = {
+            section: dict(values) if isinstance(values, dict) else values
+            for section, values in merged.items()
+        }
         
         # Validate configuration
         self._validate_config()
@@ -257,28 +378,60 @@ class ConfigurationManager:
         self.logger.info(f"Configuration loaded from {config_file}")
         return self.config.copy()
     
-    def _merge_config(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge user configuration with defaults."""
-        result = default.copy()
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_merged(cls, config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """
+        Parse a configuration file and merge it with the defaults.
         
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
+        Memoized per file version (path, mtime, size); the result is shared
+        between callers and must not be modified.
+        """
+        try:
+            with open(config_file, 'rb') as f:
+                raw_config = f.read()
+            # orjson is a faster drop-in parser when installed; both raise
+            # json.JSONDecodeError subclasses
+            if ORJSON_AVAILABLE:
+                user_config = orjson.loads(raw_config)
             else:
-                result[key] = value
+                user_config = json.loads(raw_config.decode('utf-8'))
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON in {config_file}: {e}")
+        except Exception as e:
+            raise ConfigurationError(f"Error reading {config_file}: {e}")
+        
+        return cls._merge_config(cls.DEFAULT_CONFIG, user_config)
+    
+    @staticmethod
+    def _merge_config(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge user configuration with defaults.
+        
+        Sections are flat, so each one is merged with a single dict unpack
+        instead of recursing; every section gets its own dict so callers can
+        never mutate DEFAULT_CONFIG through the result.
+        """
+        result = dict(user)
+        
+        for section, defaults in default.items():
+            overrides = user.get(section)
+            if overrides is None:
+                result[section] = dict(defaults)
+            elif isinstance(overrides, dict):
+                result[section] = {**defaults, **overrides}
         
         return result
     
     def _validate_config(self) -> None:
         """Validate the loaded configuration."""
-        errors = []
-        
         # Validate SMTP settings
         smtp = self.config.get('smtp', {})
-        required_smtp = ['server', 'username', 'password']
-        for field in required_smtp:
-            if not smtp.get(field):
-                errors.append(f"Missing required SMTP field: {field}")
+        errors = [
+            f"Missing required SMTP field: {field}"
+            for field in self.REQUIRED_SMTP_FIELDS
+            if not smtp.get(field)
+        ]
         
         # Validate port
         port = smtp.get('port')
@@ -313,6 +466,12 @@ class CSVReader:
     error handling, and data cleaning.
     """
     
+    # Large read buffer so multi-megabyte CSV files need few read() calls
+    READ_BUFFER_SIZE = 1 << 20
+    
+    # Cheap structural address check; no backtracking-prone constructs
+    EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+    
     def __init__(self, logger: Logger):
         """
         Initialize CSV reader.
@@ -322,68 +481,178 @@ class CSVReader:
         """
         self.logger = logger
     
-    def read_recipients(self, csv_file: str) -> List[Dict[str, Any]]:
+    @classmethod
+    def is_valid_email(cls, address: str) -> bool:
+        """Check that an address looks deliverable before spending an SMTP round-trip on it."""
+        return bool(address) and cls.EMAIL_PATTERN.fullmatch(address) is not None
+    
+    def read_recipients(self, csv_file: str, delimiter: str = None) -> List[Dict[str, Any]]:
         """
         Read recipient data from CSV file.
         
         Args:
             csv_file (str): Path to CSV file
+            delimiter (str, optional): Field delimiter; auto-detected if None
             
         Returns:
             List[Dict[str, Any]]: List of recipient data dictionaries
             
+        Raises:
+            CSVError: If CSV reading fails
+        """
+        return list(self.iter_recipients(csv_file, delimiter))
+    
+    def iter_recipients(self, csv_file: str, delimiter: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream recipient data from CSV file one row at a time.
+        
+        Only the current row is held in memory, so bulk sends to very large
+        lists do not need to load the whole file first.
+        
+        Args:
+            csv_file (str): Path to CSV file
+            delimiter (str, optional): Field delimiter; auto-detected if None
+            
+        Yields:
+            Dict[str, Any]: Recipient data dictionary
+            
         Raises:
             CSVError: If CSV reading fails
         """
         if not os.path.exists(csv_file):
-            raise CSVError(f"CSV file not found: {csv_file}")
+            raise CSVFileUnavailableError(f"CSV file not found: {csv_file}")
         
-        recipients = []
+        count = 0
         
         try:
-            with open(csv_file, 'r', newline='', encoding='utf-8') as csvfile:
-                # Auto-detect CSV format
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                
-                try:
-                    dialect = csv.Sniffer().sniff(sample)
-                    delimiter = dialect.delimiter
-                except csv.Error:
-                    delimiter = ','
+            with open(csv_file, 'r', newline='', encoding='utf-8',
+                      buffering=self.READ_BUFFER_SIZE) as csvfile:
+                # Auto-detect CSV format unless the delimiter is configured
+                if not delimiter:
+                    sample = csvfile.read(1024)
+                    csvfile.seek(0)
+                    
+                    try:
+                        dialect = csv.Sniffer().sniff(sample)
+                        delimiter = dialect.delimiter
+                    except csv.Error:
+                        delimiter = ','
                 
-                reader = csv.DictReader(csvfile, delimiter=delimiter)
+                reader = csv.reader(csvfile, delimiter=delimiter)
+                fieldnames = next(reader, None)
                 
-                if not reader.fieldnames:
+                if not fieldnames:
                     raise CSVError("CSV file appears to be empty or has no headers")
                 
                 # Validate required columns
-                self.logger.info(f"CSV columns found: {', '.join(reader.fieldnames)}")
+                self.logger.info(f"CSV columns found: {', '.join(fieldnames)}")
                 
-                for row_num, row in enumerate(reader, start=2):
+                # Rows are plain lists here; zipping them against the header
+                # builds each record in one C-level pass instead of DictReader's
+                # per-row dict plus a Python loop over every cell
+                column_count = len(fieldnames)
+                padding = [''] * column_count
+                strip = str.strip
+                
+                for row in reader:
                     # Skip empty rows
-                    if not any(row.values()):
+                    if not any(row):
                         continue
                     
-                    # Clean and process row data
-                    cleaned_row = {}
-                    for key, value in row.items():
-                        cleaned_row[key] = str(value).strip() if value else ''
+                    # Pad short rows so every recipient has every column
+                    if len(row) < column_count:
+                        row = row + padding[len(row):]
                     
-                    recipients.append(cleaned_row)
+                    count += 1
+                    yield dict(zip(fieldnames, map(strip, row)))
                 
-                if not recipients:
+                if not count:
                     raise CSVError("No valid recipients found in CSV file")
                 
-                self.logger.info(f"Loaded {len(recipients)} valid recipients from CSV")
-                return recipients
+                self.logger.info(f"Loaded {count} valid recipients from CSV")
                 
+        except (FileNotFoundError, PermissionError) as e:
+            raise CSVFileUnavailableError(f"Error reading CSV file: {e}") from e
         except csv.Error as e:
             raise CSVError(f"CSV parsing error: {e}")
         except UnicodeDecodeError:
             raise CSVError("CSV file encoding error. Please ensure UTF-8 encoding.")
         except Exception as e:
-            raise CSVError(f"Error reading CSV file: {e}")
+            raise CSVError(f"Error reading CSV file: {e}") from e
+
+
+class BasicTemplate:
+    """
+    Pre-parsed {{key}} template used when Jinja2 is not available.
+    
+    The source is split into literal text and placeholders once, so each
+    render is a single join instead of a regex scan. Unknown placeholders
+    are left as-is. Mirrors the render(**data) call of a Jinja2 Template.
+    """
+    
+    # {{key}} placeholders; keys may be any CSV column name
+    PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*([^{}]+?)\s*\}\}')
+    
+    # {{ name }} placeholder as Jinja2 parses it: a bare variable name
+    JINJA_VARIABLE_PATTERN = re.compile(r'\{\{\s*[A-Za-z_]\w*\s*\}\}')
+    
+    def __init__(self, source: str, missing: str = None):
+        """
+        Parse template source.
+        
+        Args:
+            source (str): Template source text
+            missing (str, optional): Text for placeholders without data;
+                None leaves the placeholder itself in place
+        """
+        # Literals at even indices, (key, fallback text) at odd indices
+        pieces = []
+        position = 0
+        for match in self.PLACEHOLDER_PATTERN.finditer(source):
+            pieces.append(source[position:match.start()])
+            pieces.append((match.group(1), match.group(0) if missing is None else missing))
+            position = match.end()
+        pieces.append(source[position:])
+        self._pieces = pieces
+    
+    @classmethod
+    def from_plain_jinja(cls, source: str) -> Optional['BasicTemplate']:
+        """
+        Compile Jinja2 source that only substitutes variables.
+        
+        Returns None if the source uses any other Jinja2 syntax (tags,
+        comments, filters, attribute access). The result renders exactly as
+        Jinja2's defaults would: newlines normalized, one trailing newline
+        dropped and undefined variables rendered empty.
+        
+        Args:
+            source (str): Template source text
+            
+        Returns:
+            Optional[BasicTemplate]: Equivalent template, or None
+        """
+        if '{%' in source or '{#' in source:
+            return None
+        if source.count('{{') != len(cls.JINJA_VARIABLE_PATTERN.findall(source)):
+            return None
+        
+        source = source.replace('\r\n', '\n').replace('\r', '\n')
+        if source.endswith('\n'):
+            source = source[:-1]
+        return cls(source, missing='')
+    
+    @property
+    def is_static(self) -> bool:
+        """Whether the template has no placeholders and renders the same for everyone."""
+        return len(self._pieces) == 1
+    
+    def render(self, /, **data: Any) -> str:
+        """Render the template with recipient data."""
+        output = self._pieces.copy()
+        for i in range(1, len(output), 2):
+            key, fallback = output[i]
+            output[i] = str(data[key]) if key in data else fallback
+        return ''.join(output)
 
 
 class TemplateRenderer:
@@ -394,20 +663,39 @@ class TemplateRenderer:
     both Jinja2 templates and simple placeholder replacement.
     """
     
-    def __init__(self, logger: Logger, template_directory: str = None):
+    def __init__(self, logger: Logger, template_directory: str = None,
+                 bytecode_cache_directory: str = None):
         """
         Initialize template renderer.
         
         Args:
             logger (Logger): Application logger instance
             template_directory (str): Directory containing templates
+            bytecode_cache_directory (str, optional): Directory where compiled
+                Jinja2 templates are kept between runs
         """
         self.logger = logger
         self.template_directory = template_directory
         self.jinja_env = None
+        # Compiled templates keyed by (path, mtime) so edits are picked up
+        self._template_cache = {}
+        
+        if not JINJA2_AVAILABLE:
+            return
         
-        if JINJA2_AVAILABLE and template_directory:
-            self.jinja_env = Environment(loader=FileSystemLoader(template_directory))
+        bytecode_cache = None
+        if bytecode_cache_directory:
+            try:
+                Path(bytecode_cache_directory).mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(bytecode_cache_directory)
+            except OSError as e:
+                self.logger.warning(f"Template bytecode cache disabled: {e}")
+        
+        if template_directory or bytecode_cache:
+            self.jinja_env = Environment(
+                loader=FileSystemLoader(template_directory) if template_directory else None,
+                bytecode_cache=bytecode_cache
+            )
     
     def render_template(self, template_path: str, data: Dict[str, Any]) -> str:
         """
@@ -423,37 +711,104 @@ class TemplateRenderer:
         Raises:
             TemplateError: If template rendering fails
         """
-        if not os.path.exists(template_path):
+        template = self.get_template(template_path)
+        
+        try:
+            rendered = self.render_compiled(template, data)
+            
+            self.logger.debug(f"Template rendered for {data.get('email', 'unknown recipient')}")
+            return rendered
+            
+        except Exception as e:
+            raise TemplateError(f"Template rendering error: {e}")
+    
+    def get_template(self, template_path: str) -> Any:
+        """
+        Load a template, compiling it only once per file version.
+        
+        Args:
+            template_path (str): Path to template file
+            
+        Returns:
+            Any: Compiled Jinja2 template, or the raw content without Jinja2
+            
+        Raises:
+            TemplateError: If the template cannot be read or compiled
+        """
+        try:
+            cache_key = (template_path, os.path.getmtime(template_path))
+        except OSError:
             raise TemplateError(f"Template file not found: {template_path}")
         
+        template = self._template_cache.get(cache_key)
+        if template is not None:
+            return template
+        
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
+            template_content = Path(template_path).read_text(encoding='utf-8')
         except Exception as e:
             raise TemplateError(f"Error reading template file: {e}")
         
-        try:
-            if JINJA2_AVAILABLE:
-                # Use Jinja2 for advanced templating
-                template = Template(template_content)
-                rendered = template.render(**data)
-            else:
-                # Use basic string replacement
-                rendered = self._basic_template_replace(template_content, data)
+        template = self.compile_string(template_content)
+        
+        # Drop stale versions of this template before caching the new one
+        for key in [key for key in self._template_cache if key[0] == template_path]:
+            del self._template_cache[key]
+        self._template_cache[cache_key] = template
+        self.logger.debug(f"Template compiled: {template_path}")
+        return template
+    
+    def compile_string(self, source: str) -> Any:
+        """
+        Compile template source once for repeated rendering.
+        
+        Args:
+            source (str): Template source text
             
-            self.logger.debug(f"Template rendered for {data.get('email', 'unknown recipient')}")
-            return rendered
+        Returns:
+            Any: Compiled Jinja2 template, or a BasicTemplate without Jinja2
             
+        Raises:
+            TemplateError: If the template cannot be compiled
+        """
+        if not JINJA2_AVAILABLE:
+            return BasicTemplate(source)
+        
+        # Pure {{ name }} substitution renders without Jinja2's runtime
+        template = BasicTemplate.from_plain_jinja(source)
+        if template is not None:
+            return template
+        
+        try:
+            if self.jinja_env is None:
+                return Template(source)
+            if self.jinja_env.bytecode_cache is None:
+                return self.jinja_env.from_string(source)
+            return self._load_cached_bytecode(source)
         except Exception as e:
-            raise TemplateError(f"Template rendering error: {e}")
+            raise TemplateError(f"Template compilation error: {e}")
+    
+    def _load_cached_bytecode(self, source: str) -> Any:
+        """
+        Compile template source through the on-disk bytecode cache.
+        
+        Environment.from_string never consults the bytecode cache, so this
+        does what a loader would: the cache entry is named after the source
+        hash and only compiled when missing or stale.
+        """
+        env = self.jinja_env
+        name = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        
+        bucket = env.bytecode_cache.get_bucket(env, name, None, source)
+        if bucket.code is None:
+            bucket.code = env.compile(source, name)
+            env.bytecode_cache.set_bucket(bucket)
+        
+        return env.template_class.from_code(env, bucket.code, env.make_globals(None))
     
-    def _basic_template_replace(self, content: str, data: Dict[str, Any]) -> str:
-        """Basic template replacement for when Jinja2 is not available."""
-        rendered = content
-        for key, value in data.items():
-            placeholder = f"{{{{{key}}}}}"
-            rendered = rendered.replace(placeholder, str(value))
-        return rendered
+    def render_compiled(self, template: Any, data: Dict[str, Any]) -> str:
+        """Render a template returned by compile_string with recipient data."""
+        return template.render(**data)
 
 
 class AttachmentHandler:
@@ -461,9 +816,13 @@ class AttachmentHandler:
     Handles email attachments with MIME type detection and validation.
     
     Creates appropriate MIME objects for different file types
-    with size limits and error handling.
+    with size limits and error handling. Encoded parts are cached per file
+    version and shared between messages, which never modify them.
     """
     
+    # Encoded attachment parts kept for reuse
+    MAX_CACHED_ATTACHMENTS = 10
+    
     def __init__(self, logger: Logger, max_size_mb: int = 25):
         """
         Initialize attachment handler.
@@ -474,6 +833,27 @@ class AttachmentHandler:
         """
         self.logger = logger
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        # Encoded parts keyed by absolute path: ((mtime_ns, size), part)
+        self._attachment_cache = {}
+        
+        # Load the system MIME tables up front rather than on the first attachment
+        mimetypes.init()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _guess_type(extension: str) -> tuple:
+        """
+        Return the (main type, sub type) pair for a lower-cased file extension.
+        
+        Cached because a bulk send typically attaches the same few file types.
+        Compressed files (e.g. .gz) fall back to application/octet-stream.
+        """
+        content_type, encoding = mimetypes.guess_type('attachment' + extension)
+        
+        if content_type is None or encoding is not None:
+            content_type = 'application/octet-stream'
+        
+        return tuple(content_type.split('/', 1))
     
     def create_attachment(self, file_path: str) -> MIMEBase:
         """
@@ -494,29 +874,37 @@ class AttachmentHandler:
         if not os.path.isfile(file_path):
             raise EmailSendError(f"Attachment path is not a file: {file_path}")
         
-        file_size = os.path.getsize(file_path)
+        file_stat = os.stat(file_path)
+        file_size = file_stat.st_size
         if file_size > self.max_size_bytes:
             size_mb = file_size / (1024 * 1024)
             max_mb = self.max_size_bytes / (1024 * 1024)
             raise EmailSendError(f"File too large: {size_mb:.1f}MB (max: {max_mb}MB)")
         
-        file_name = os.path.basename(file_path)
-        content_type, encoding = mimetypes.guess_type(file_path)
-        
-        if content_type is None or encoding is not None:
-            content_type = 'application/octet-stream'
+        # Reuse the encoded part while the file is unchanged
+        cache_key = os.path.abspath(file_path)
+        file_version = (file_stat.st_mtime_ns, file_size)
+        cached = self._attachment_cache.get(cache_key)
+        if cached is not None and cached[0] == file_version:
+            return cached[1]
         
-        main_type, sub_type = content_type.split('/', 1)
+        file_name = os.path.basename(file_path)
+        main_type, sub_type = self._guess_type(os.path.splitext(file_path)[1].lower())
         
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            # Text is decoded while reading; only binary types need the raw bytes
+            if main_type == 'text':
+                with open(file_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+                    file_data = f.read()
+            else:
+                with open(file_path, 'rb') as f:
+                    file_data = f.read()
         except Exception as e:
             raise EmailSendError(f"Cannot read attachment file: {e}")
         
         # Create appropriate MIME object
         if main_type == 'text':
-            attachment = MIMEText(file_data.decode('utf-8', errors='replace'), _subtype=sub_type)
+            attachment = MIMEText(file_data, _subtype=sub_type)
         elif main_type == 'image':
             attachment = MIMEImage(file_data, _subtype=sub_type)
         elif main_type == 'audio':
@@ -526,10 +914,366 @@ class AttachmentHandler:
         
         attachment.add_header('Content-Disposition', f'attachment; filename="{file_name}"')
         
+        # Keep at most MAX_CACHED_ATTACHMENTS parts, dropping the oldest
+        self._attachment_cache.pop(cache_key, None)
+        if len(self._attachment_cache) >= self.MAX_CACHED_ATTACHMENTS:
+            del self._attachment_cache[next(iter(self._attachment_cache))]
+        self._attachment_cache[cache_key] = (file_version, attachment)
+        
         self.logger.debug(f"Created attachment: {file_name} ({file_size} bytes)")
         return attachment
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket pacing sends to one destination.
+    
+    reserve() takes a token immediately and returns how long the caller must
+    wait before using it, so threads can time.sleep() and coroutines can
+    asyncio.sleep() on the same bucket. penalize() halves the rate for
+    PENALTY_SECONDS each time the server signals it is throttling.
+    """
+    
+    PENALTY_SECONDS = 60.0
+    
+    def __init__(self, rate_per_minute: float, capacity: float = 1.0):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate_per_minute (float): Sustained sends per minute
+            capacity (float): Burst size in messages
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._penalty = 0
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _current_rate(self, now: float) -> float:
+        """Return the refill rate, reduced while a penalty is active."""
+        if self._penalty and now >= self._penalty_until:
+            self._penalty = 0
+        return self.rate / (2 ** self._penalty)
+    
+    def reserve(self) -> float:
+        """Take a token; return the seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self._current_rate(now)
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / rate
+    
+    def penalize(self) -> None:
+        """Halve the rate for the next PENALTY_SECONDS."""
+        with self._lock:
+            now = time.monotonic()
+            self._current_rate(now)
+            self._penalty += 1
+            self._penalty_until = now + self.PENALTY_SECONDS
+
+
+class DomainRateLimiter:
+    """
+    Per-recipient-domain send rate limits.
+    
+    Configured as application.rate_limits, a mapping of domain to messages
+    per minute, e.g. {"gmail.com": 20, "default": 60}. The "default" rate
+    applies to every other domain; domains without a rate are not limited.
+    Each domain gets its own TokenBucket shared by all send workers.
+    """
+    
+    def __init__(self, rate_limits: Dict[str, float]):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rate_limits (Dict[str, float]): Messages per minute by domain
+        """
+        self._rates = {domain.lower(): rate for domain, rate in rate_limits.items() if rate}
+        self._buckets = {}
+        self._lock = threading.Lock()
+    
+    def _bucket(self, address: str) -> Optional[TokenBucket]:
+        """Return the bucket for an address's domain, or None if unlimited."""
+        domain = address.rpartition('@')[2].lower()
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                rate = self._rates.get(domain, self._rates.get('default'))
+                if rate is None:
+                    return None
+                bucket = self._buckets[domain] = TokenBucket(rate)
+            return bucket
+    
+    def reserve(self, address: str) -> float:
+        """Take a send slot for an address; return the seconds to wait."""
+        bucket = self._bucket(address)
+        return bucket.reserve() if bucket else 0.0
+    
+    def penalize(self, address: str) -> None:
+        """Slow down the address's domain after a throttling reply."""
+        bucket = self._bucket(address)
+        if bucket:
+            bucket.penalize()
+
+
+class PipeliningMixin:
+    """
+    SMTP client mixin that pipelines the envelope (RFC 2920).
+    
+    When the server advertises PIPELINING, MAIL FROM and every RCPT TO go
+    out in a single write and their replies are read afterwards, saving a
+    round trip per envelope command. DATA is still sent only once the
+    replies are in, so a message is never transmitted after all of its
+    recipients were refused. Without PIPELINING the stock sendmail is used.
+    """
+    
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        """Send a message, pipelining MAIL and RCPT if the server allows it."""
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn('pipelining'):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(msg, str):
+            msg = smtplib._fix_eols(msg).encode('ascii')
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        
+        mail_options = list(mail_options)
+        if self.has_extn('size'):
+            mail_options.insert(0, f"size={len(msg)}")
+        if any(option.lower() == 'smtputf8' for option in mail_options):
+            if not self.has_extn('smtputf8'):
+                raise smtplib.SMTPNotSupportedError(
+                    'SMTPUTF8 not supported by server')
+            self.command_encoding = 'utf-8'
+        
+        commands = [f"mail FROM:{smtplib.quoteaddr(from_addr)}{self._options(mail_options)}"]
+        commands.extend(
+            f"rcpt TO:{smtplib.quoteaddr(address)}{self._options(rcpt_options)}"
+            for address in to_addrs
+        )
+        if any('\r' in command or '\n' in command for command in commands):
+            raise ValueError('command and arguments contain prohibited newline characters')
+        self.send(''.join(f"{command}\r\n" for command in commands))
+        
+        code, resp = self.getreply()
+        if code == 421:
+            self.close()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+        rcpt_replies = [self.getreply() for _ in to_addrs]
+        if code != 250:
+            self._rset()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+        
+        refused = {}
+        for address, (rcpt_code, rcpt_resp) in zip(to_addrs, rcpt_replies):
+            if rcpt_code not in (250, 251):
+                refused[address] = (rcpt_code, rcpt_resp)
+            if rcpt_code == 421:
+                self.close()
+                raise smtplib.SMTPRecipientsRefused(refused)
+        if len(refused) == len(to_addrs):
+            self._rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        
+        code, resp = self.data(msg)
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+    
+    @staticmethod
+    def _options(options) -> str:
+        """Format ESMTP parameters the way smtplib appends them to a command."""
+        return ' ' + ' '.join(options) if options else ''
+
+
+class PipelinedSMTP(PipeliningMixin, smtplib.SMTP):
+    """smtplib.SMTP with envelope pipelining."""
+
+
+class PipelinedSMTPSSL(PipeliningMixin, smtplib.SMTP_SSL):
+    """smtplib.SMTP_SSL with envelope pipelining."""
+
+
+class SMTPSession:
+    """
+    Persistent SMTP session reused across several messages.
+    
+    Holds a single authenticated connection for the duration of a bulk send.
+    The connection is opened lazily on the first message, checked with NOOP
+    before each following one and re-established if the server dropped it.
+    After MAX_MESSAGES_PER_CONNECTION messages it is replaced, since many
+    servers cap the number of messages accepted per connection.
+    """
+    
+    MAX_MESSAGES_PER_CONNECTION = 100
+    
+    def __init__(self, email_sender: 'EmailSender', smtp_config: Dict[str, Any]):
+        """
+        Initialize SMTP session.
+        
+        Args:
+            email_sender (EmailSender): Sender used to create connections
+            smtp_config (Dict[str, Any]): SMTP configuration
+        """
+        self.email_sender = email_sender
+        self.smtp_config = smtp_config
+        self.connection = None
+        self.messages_sent = 0
+        self.aborted = False
+    
+    def __enter__(self) -> 'SMTPSession':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def connect(self) -> None:
+        """Open a new authenticated connection, replacing any existing one."""
+        if self.aborted:
+            raise EmailSendError("SMTP session was aborted")
+        self.close()
+        self.email_sender.logger.log_smtp_connection(
+            self.smtp_config['server'],
+            self.smtp_config['port'],
+            self.smtp_config['username']
+        )
+        self.connection = self.email_sender._create_smtp_connection(self.smtp_config)
+        self.messages_sent = 0
+    
+    def is_alive(self) -> bool:
+        """Check whether the server still accepts commands on this connection."""
+        if self.connection is None:
+            return False
+        try:
+            return self.connection.noop()[0] == 250
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+            return False
+    
+    def send_message(self, msg: MIMEBase, to_addrs: List[str] = None) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Send a message, reconnecting first if the connection was dropped.
+        
+        Args:
+            msg (MIMEBase): Message to send
+            to_addrs (List[str], optional): Envelope recipients; parsed from
+                the message headers if None
+            
+        Returns:
+            Dict[str, Tuple[int, bytes]]: SMTP reply for each refused recipient
+        """
+        if self.messages_sent >= self.MAX_MESSAGES_PER_CONNECTION:
+            self.connect()
+        elif not self.is_alive():
+            if self.connection is not None:
+                self.email_sender.logger.warning("SMTP connection lost - reconnecting")
+            self.connect()
+        refused = self.connection.send_message(msg, to_addrs=to_addrs)
+        self.messages_sent += 1
+        return refused
+    
+    def close(self) -> None:
+        """Close the connection, ignoring errors from an already dead socket."""
+        if self.connection is None:
+            return
+        try:
+            self.connection.quit()
+        except Exception:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+        self.connection = None
+    
+    def abort(self) -> None:
+        """
+        Abort the session from another thread.
+        
+        Shuts the socket down so a send blocked on the network fails at once
+        instead of waiting for the SMTP timeout, and keeps the session from
+        reconnecting. The owning thread still calls close() to release it.
+        """
+        self.aborted = True
+        sock = getattr(self.connection, 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class SMTPSessionPool:
+    """
+    Thread-safe pool of SMTP sessions for one server and account.
+    
+    Lets callers that send one message at a time from several threads (the
+    GUI worker) reuse authenticated connections instead of connecting per
+    message. A session is created only when no idle one is available, so the
+    pool grows to the number of threads sending at once.
+    """
+    
+    def __init__(self, email_sender: 'EmailSender', smtp_config: Dict[str, Any]):
+        """
+        Initialize session pool.
+        
+        Args:
+            email_sender (EmailSender): Sender used to create connections
+            smtp_config (Dict[str, Any]): SMTP configuration
+        """
+        self.email_sender = email_sender
+        self.smtp_config = smtp_config
+        # Most recently used first - the likeliest to still be connected
+        self._idle = queue.LifoQueue()
+        # Sessions currently borrowed, so abort() can reach ones mid-send
+        self._borrowed = set()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def session(self) -> Iterator[SMTPSession]:
+        """Borrow a session for the duration of a with block."""
+        try:
+            smtp_conn = self._idle.get_nowait()
+        except queue.Empty:
+            smtp_conn = SMTPSession(self.email_sender, self.smtp_config)
+        with self._lock:
+            self._borrowed.add(smtp_conn)
+        try:
+            yield smtp_conn
+        finally:
+            with self._lock:
+                self._borrowed.discard(smtp_conn)
+            # An aborted session refuses to reconnect, so it is not reusable
+            if smtp_conn.aborted:
+                smtp_conn.close()
+            else:
+                self._idle.put(smtp_conn)
+    
+    def close(self) -> None:
+        """Close all idle sessions; the pool stays usable afterwards."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+    
+    def abort(self) -> None:
+        """Abort every borrowed session, including ones mid-send on other threads."""
+        with self._lock:
+            sessions = list(self._borrowed)
+        for smtp_conn in sessions:
+            smtp_conn.abort()
+
+
 class EmailSender:
     """
     Handles SMTP email sending with comprehensive error handling and logging.
@@ -538,6 +1282,12 @@ class EmailSender:
     and attachments with detailed logging of all operations.
     """
     
+    # Required connection settings, fetched in one call per connection
+    _smtp_settings = staticmethod(itemgetter('server', 'port', 'username', 'password'))
+    
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    
     def __init__(self, logger: Logger, attachment_handler: AttachmentHandler):
         """
         Initialize email sender.
@@ -548,6 +1298,12 @@ class EmailSender:
         """
         self.logger = logger
         self.attachment_handler = attachment_handler
+        self._ssl_context = None
+        # Optional DomainRateLimiter applied before every send attempt
+        self.rate_limiter = None
+        # Session pools keyed by server, port and credentials
+        self._session_pools = {}
+        self._session_pools_lock = threading.Lock()
     
     def send_email(self, 
                    smtp_config: Dict[str, Any],
@@ -557,7 +1313,8 @@ class EmailSender:
                    body: str,
                    html_body: str = None,
                    attachments: List[str] = None,
-                   sender_name: str = None) -> bool:
+                   sender_name: str = None,
+                   smtp_conn: SMTPSession = None) -> bool:
         """
         Send email via SMTP.
         
@@ -570,6 +1327,8 @@ class EmailSender:
             html_body (str, optional): HTML email body
             attachments (List[str], optional): List of attachment file paths
             sender_name (str, optional): Sender display name
+            smtp_conn (SMTPSession, optional): Open session to reuse instead of
+                connecting for this message only
             
         Returns:
             bool: True if email sent successfully
@@ -582,90 +1341,612 @@ class EmailSender:
         if not recipients:
             raise EmailSendError("No recipients specified")
         
-        recipient_str = ', '.join(recipients)
-        self.logger.info(f"Sending email to: {recipient_str}")
-        self.logger.log_smtp_connection(
-            smtp_config['server'], 
-            smtp_config['port'], 
-            smtp_config['username']
-        )
+        self.logger.info(f"Sending email to: {', '.join(recipients)}")
         
-        # Create message
-        msg = MIMEMultipart('alternative')
-        msg['From'] = f"{sender_name} <{sender}>" if sender_name else sender
-        msg['To'] = recipient_str
-        msg['Subject'] = subject
+        msg = self.build_message(sender, recipients, subject, body,
+                                 html_body, attachments, sender_name)
         
-        # Add body content
+        return self.deliver_message(smtp_config, msg, recipients, subject,
+                                    len(attachments or []), smtp_conn)
+    
+    def build_message(self,
+                      sender: str,
+                      recipients: List[str],
+                      subject: str,
+                      body: str,
+                      html_body: str = None,
+                      attachments: List[str] = None,
+                      sender_name: str = None,
+                      attachment_parts: List[MIMEBase] = None) -> MIMEBase:
+        """
+        Build a ready-to-send MIME message.
+        
+        Args:
+            sender (str): Sender email address
+            recipients (List[str]): Recipient email addresses
+            subject (str): Email subject
+            body (str): Email body (plain text)
+            html_body (str, optional): HTML email body
+            attachments (List[str], optional): List of attachment file paths
+            sender_name (str, optional): Sender display name
+            attachment_parts (List[MIMEBase], optional): Attachments already
+                built by prepare_attachments, used instead of attachments
+            
+        Returns:
+            MIMEBase: Assembled email message
+            
+        Raises:
+            EmailSendError: If an attachment cannot be added
+        """
+        if attachment_parts is None:
+            attachment_parts = self.prepare_attachments(attachments)
+        
+        template = self.build_message_template(sender, sender_name, attachment_parts)
+        return self.personalize_message(template, recipients, subject, body, html_body)
+    
+    def build_message_template(self,
+                               sender: str,
+                               sender_name: str = None,
+                               attachment_parts: List[MIMEBase] = None) -> MIMEMultipart:
+        """
+        Build the recipient-independent part of a message.
+        
+        Holds the From header and attachments; personalize_message derives
+        one message per recipient from it without rebuilding either.
+        
+        Args:
+            sender (str): Sender email address
+            sender_name (str, optional): Sender display name
+            attachment_parts (List[MIMEBase], optional): Prepared attachments
+            
+        Returns:
+            MIMEMultipart: Message template
+        """
+        template = MIMEMultipart('mixed')
+        template['From'] = f"{sender_name} <{sender}>" if sender_name else sender
+        for attachment in attachment_parts or []:
+            template.attach(attachment)
+        return template
+    
+    def personalize_message(self,
+                            template: MIMEMultipart,
+                            recipients: List[str],
+                            subject: str,
+                            body: str,
+                            html_body: str = None,
+                            part_cache: Dict[str, Tuple[str, MIMEText]] = None) -> MIMEBase:
+        """
+        Derive a recipient's message from a template.
+        
+        Plain-text messages without attachments are sent as a bare text/plain
+        message; an HTML body adds a multipart/alternative part and
+        attachments wrap the body in multipart/mixed.
+        
+        Args:
+            template (MIMEMultipart): Template from build_message_template
+            recipients (List[str]): Recipient email addresses
+            subject (str): Email subject
+            body (str): Email body (plain text)
+            html_body (str, optional): HTML email body
+            part_cache (Dict, optional): Empty dict kept for one bulk run, so
+                consecutive identical bodies share one encoded part
+            
+        Returns:
+            MIMEBase: Message sharing the template's attachment parts
+        """
+        body_part = self._text_part(body, 'plain', part_cache)
         if html_body:
-            text_part = MIMEText(body, 'plain')
-            html_part = MIMEText(html_body, 'html')
-            msg.attach(text_part)
-            msg.attach(html_part)
+            body_part = MIMEMultipart(
+                'alternative',
+                _subparts=[body_part, self._text_part(html_body, 'html', part_cache)]
+            )
+        
+        attachment_parts = template.get_payload()
+        if attachment_parts:
+            # Body first, then the template's shared attachment parts
+            msg = copy.copy(template)
+            msg.set_payload([body_part] + attachment_parts)
         else:
-            text_part = MIMEText(body, 'plain')
-            msg.attach(text_part)
+            # Nothing to attach - the body itself is the whole message
+            msg = copy.copy(body_part)
+        
+        # Deleting rebinds the header list, so the shallow copy stops
+        # sharing headers with the template or cached part before new ones are added
+        del msg['From']
+        del msg['To']
+        del msg['Subject']
+        msg['From'] = template['From']
+        msg['To'] = ', '.join(recipients)
+        msg['Subject'] = subject
         
-        # Add attachments
-        attachment_count = 0
-        if attachments:
-            for file_path in attachments:
-                try:
-                    attachment = self.attachment_handler.create_attachment(file_path)
-                    msg.attach(attachment)
-                    attachment_count += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to attach {file_path}: {e}")
-                    raise EmailSendError(f"Attachment error: {e}")
+        return msg
+    
+    @staticmethod
+    def _text_part(text: str, subtype: str,
+                   part_cache: Dict[str, Tuple[str, MIMEText]] = None) -> MIMEText:
+        """
+        Return an encoded body part for text, reusing the previous one if identical.
+        
+        Recipients whose rendered body is the same share one part, as the
+        attachments do, instead of re-encoding it for each message. Only the
+        last body is kept, so personalized runs cost one string comparison
+        per message and hold no more than one body.
+        """
+        if part_cache is None:
+            return MIMEText(text, subtype)
+        cached = part_cache.get(subtype)
+        if cached is None or cached[0] != text:
+            cached = part_cache[subtype] = (text, MIMEText(text, subtype))
+        return cached[1]
+    
+    def prepare_attachments(self, attachments: List[str] = None) -> List[MIMEBase]:
+        """
+        Read and encode attachment files into MIME parts.
         
-        # Send email
+        The parts are never modified when a message is sent, so a bulk send
+        builds them once and attaches the same objects to every message.
+        
+        Args:
+            attachments (List[str], optional): List of attachment file paths
+            
+        Returns:
+            List[MIMEBase]: Encoded attachment parts
+            
+        Raises:
+            EmailSendError: If an attachment cannot be created
+        """
+        parts = []
+        for file_path in attachments or []:
+            try:
+                parts.append(self.attachment_handler.create_attachment(file_path))
+            except Exception as e:
+                self.logger.error(f"Failed to attach {file_path}: {e}")
+                raise EmailSendError(f"Attachment error: {e}")
+        return parts
+    
+    def deliver_message(self,
+                        smtp_config: Dict[str, Any],
+                        msg: MIMEBase,
+                        recipients: List[str],
+                        subject: str,
+                        attachment_count: int = 0,
+                        smtp_conn: SMTPSession = None) -> bool:
+        """
+        Deliver a built message, retrying transient SMTP failures.
+        
+        Args:
+            smtp_config (Dict[str, Any]): SMTP configuration
+            msg (MIMEBase): Message from build_message
+            recipients (List[str]): Recipient email addresses (for logging)
+            subject (str): Email subject (for logging)
+            attachment_count (int): Number of attachments (for logging)
+            smtp_conn (SMTPSession, optional): Open session to reuse
+            
+        Returns:
+            bool: True if email sent successfully
+            
+        Raises:
+            EmailSendError: If email sending fails
+        """
+        failures = self.try_deliver_message(smtp_config, msg, recipients, subject,
+                                            attachment_count, smtp_conn)
+        # Refused recipients are logged; only a message nobody got is an error
+        if failures and len(failures) >= len(recipients):
+            raise EmailSendError(next(iter(failures.values())))
+        return True
+    
+    def try_deliver_message(self,
+                            smtp_config: Dict[str, Any],
+                            msg: MIMEBase,
+                            recipients: List[str],
+                            subject: str,
+                            attachment_count: int = 0,
+                            smtp_conn: SMTPSession = None) -> Dict[str, str]:
+        """
+        Deliver a built message, returning errors instead of raising.
+        
+        Same as deliver_message; bulk sends use this so a failing server
+        does not cost an extra exception per recipient.
+        
+        Returns:
+            Dict[str, str]: Error message for each recipient that was not
+                sent; empty if the server accepted every recipient
+        """
         try:
-            with self._create_smtp_connection(smtp_config) as smtp_server:
-                smtp_server.send_message(msg)
-                
-                for recipient_email in recipients:
-                    self.logger.log_email_success(recipient_email, subject, attachment_count)
-                
-                return True
+            if smtp_conn is not None:
+                refused = self._send_with_retry(smtp_conn, msg, recipients)
+            else:
+                with self.open_session(smtp_config) as session:
+                    refused = self._send_with_retry(session, msg, recipients)
                 
         except Exception as e:
             error_msg = str(e)
             for recipient_email in recipients:
                 self.logger.log_email_failure(recipient_email, error_msg, subject)
-            raise EmailSendError(f"SMTP error: {error_msg}")
+            return dict.fromkeys(recipients, f"SMTP error: {error_msg}")
+        
+        failures = {}
+        for recipient_email in recipients:
+            reply = refused.get(recipient_email)
+            if reply is None:
+                self.logger.log_email_success(recipient_email, subject, attachment_count)
+                continue
+            code, resp = reply
+            error_msg = f"Recipient refused ({code}): {resp.decode('utf-8', 'replace')}"
+            self.logger.log_email_failure(recipient_email, error_msg, subject)
+            failures[recipient_email] = f"SMTP error: {error_msg}"
+        return failures
+    
+    def _send_with_retry(self, smtp_conn: SMTPSession, msg: MIMEBase,
+                         recipients: List[str] = ()) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Send over a session, backing off exponentially on transient SMTP replies.
+        
+        Returns:
+            Dict[str, Tuple[int, bytes]]: SMTP reply for each refused recipient
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            wait = self._rate_limit_wait(recipients)
+            if wait:
+                time.sleep(wait)
+            try:
+                # Known recipients spare smtplib re-parsing the To header
+                return smtp_conn.send_message(msg, to_addrs=list(recipients) or None)
+            except smtplib.SMTPResponseException as e:
+                if not self._is_transient(e.smtp_code) or attempt == self.MAX_RETRIES:
+                    raise
+                self._rate_limit_penalize(recipients)
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(
+                    f"SMTP temporary failure ({e.smtp_code}) - retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            except smtplib.SMTPRecipientsRefused as e:
+                # Greylisting refuses every RCPT with a 4xx until the message is retried
+                codes = [code for code, _ in e.recipients.values()]
+                if not all(map(self._is_transient, codes)) or attempt == self.MAX_RETRIES:
+                    raise
+                self._rate_limit_penalize(recipients)
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(
+                    f"SMTP recipients temporarily refused ({codes[0]}) - retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            except SMTPConnectionError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(
+                    f"SMTP connection failed ({e}) - retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            except smtplib.SMTPServerDisconnected:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                # Drop the dead connection; the retry sends over a fresh one
+                smtp_conn.close()
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(
+                    f"SMTP connection dropped mid-send - retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+    
+    def _is_transient(self, smtp_code: int) -> bool:
+        """Whether an SMTP reply code is worth retrying (RFC 5321 4yz replies only)."""
+        return 400 <= smtp_code < 500
+    
+    def _rate_limit_wait(self, recipients: List[str]) -> float:
+        """Reserve rate-limit slots for the recipients; return the seconds to wait."""
+        if self.rate_limiter is None:
+            return 0.0
+        return max((self.rate_limiter.reserve(address) for address in recipients), default=0.0)
+    
+    def _rate_limit_penalize(self, recipients: List[str]) -> None:
+        """Slow down the recipients' domains after a throttling reply."""
+        if self.rate_limiter is not None:
+            for address in recipients:
+                self.rate_limiter.penalize(address)
+    
+    def session_pool(self, smtp_config: Dict[str, Any]) -> SMTPSessionPool:
+        """
+        Return the shared session pool for an SMTP server and account.
+        
+        Keyed on the credentials as well, so changed settings get fresh
+        connections instead of reusing ones logged in with the old password.
+        
+        Args:
+            smtp_config (Dict[str, Any]): SMTP configuration
+            
+        Returns:
+            SMTPSessionPool: Pool to borrow sessions from
+        """
+        key = self._smtp_settings(smtp_config)
+        with self._session_pools_lock:
+            pool = self._session_pools.get(key)
+            if pool is None:
+                pool = self._session_pools[key] = SMTPSessionPool(self, smtp_config)
+            return pool
+    
+    def open_session(self, smtp_config: Dict[str, Any]) -> SMTPSession:
+        """
+        Open a persistent SMTP session for sending several messages.
+        
+        Args:
+            smtp_config (Dict[str, Any]): SMTP configuration
+            
+        Returns:
+            SMTPSession: Session to use as a context manager
+        """
+        return SMTPSession(self, smtp_config)
+    
+    async def open_async_connection(self, smtp_config: Dict[str, Any]):
+        """
+        Open an authenticated aiosmtplib connection.
+        
+        Args:
+            smtp_config (Dict[str, Any]): SMTP configuration
+            
+        Returns:
+            aiosmtplib.SMTP: Connected client
+            
+        Raises:
+            EmailSendError: If connecting or logging in fails
+        """
+        try:
+            server, port, username, password = self._smtp_settings(smtp_config)
+            self.logger.log_smtp_connection(server, port, username)
+            
+            use_ssl = smtp_config.get('use_ssl', False)
+            smtp = aiosmtplib.SMTP(
+                hostname=server,
+                port=port,
+                use_tls=use_ssl,
+                start_tls=False if use_ssl else smtp_config.get('use_tls', True),
+                tls_context=self.ssl_context if use_ssl else None,
+                timeout=smtp_config.get('timeout', 30)
+            )
+            await smtp.connect()
+            await smtp.login(username, password)
+            return smtp
+            
+        except aiosmtplib.SMTPAuthenticationError as e:
+            raise EmailSendError(f"SMTP authentication failed: {e}")
+        except aiosmtplib.SMTPException as e:
+            raise EmailSendError(f"SMTP error: {e}")
+        except Exception as e:
+            raise EmailSendError(f"Connection error: {e}")
+    
+    async def send_async_with_retry(self, smtp, msg: MIMEBase,
+                                    recipients: List[str] = ()) -> None:
+        """Send over an aiosmtplib connection, backing off on transient SMTP replies."""
+        import asyncio
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            wait = self._rate_limit_wait(recipients)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                await smtp.send_message(msg, recipients=list(recipients) or None)
+                return
+            except aiosmtplib.SMTPResponseException as e:
+                if not self._is_transient(e.code) or attempt == self.MAX_RETRIES:
+                    raise
+                self._rate_limit_penalize(recipients)
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(
+                    f"SMTP temporary failure ({e.code}) - retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+            except aiosmtplib.SMTPRecipientsRefused as e:
+                codes = [refusal.code for refusal in e.recipients]
+                if not all(map(self._is_transient, codes)) or attempt == self.MAX_RETRIES:
+                    raise
+                self._rate_limit_penalize(recipients)
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(
+                    f"SMTP recipients temporarily refused ({codes[0]}) - retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+    
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """Default SSL context, created once since loading CA certificates is slow."""
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
     
     def _create_smtp_connection(self, smtp_config: Dict[str, Any]):
         """Create and configure SMTP connection."""
         try:
+            server, port, username, password = self._smtp_settings(smtp_config)
+            timeout = smtp_config.get('timeout', 30)
+            
             if smtp_config.get('use_ssl', False):
-                context = ssl.create_default_context()
-                smtp = smtplib.SMTP_SSL(
-                    smtp_config['server'],
-                    smtp_config['port'],
-                    context=context,
-                    timeout=smtp_config.get('timeout', 30)
+                smtp = PipelinedSMTPSSL(
+                    server,
+                    port,
+                    context=self.ssl_context,
+                    timeout=timeout
                 )
             else:
-                smtp = smtplib.SMTP(
-                    smtp_config['server'],
-                    smtp_config['port'],
-                    timeout=smtp_config.get('timeout', 30)
-                )
+                smtp = PipelinedSMTP(server, port, timeout=timeout)
                 
                 if smtp_config.get('use_tls', True):
                     smtp.starttls()
             
-            smtp.login(smtp_config['username'], smtp_config['password'])
+            smtp.login(username, password)
             return smtp
             
         except smtplib.SMTPAuthenticationError as e:
             raise EmailSendError(f"SMTP authentication failed: {e}")
+        except smtplib.SMTPConnectError as e:
+            # A 5xx greeting means the server will not take mail from us at all
+            if not self._is_transient(e.smtp_code):
+                raise EmailSendError(f"SMTP error: {e}")
+            raise SMTPConnectionError(f"SMTP error: {e}")
+        except smtplib.SMTPServerDisconnected as e:
+            raise SMTPConnectionError(f"SMTP error: {e}")
         except smtplib.SMTPException as e:
             raise EmailSendError(f"SMTP error: {e}")
+        except OSError as e:
+            raise SMTPConnectionError(f"Connection error: {e}")
         except Exception as e:
             raise EmailSendError(f"Connection error: {e}")
 
 
+class BulkSendResults:
+    """
+    Thread-safe tally of a bulk email send.
+    
+    Shared by all send workers; summary() produces the results dictionary
+    returned by EmailApplication.send_bulk_emails. Only the first MAX_ERRORS
+    error messages are kept, and the send is aborted once more than
+    ABORT_FAILURE_RATIO of delivery attempts fail, checked every
+    ABORT_CHECK_INTERVAL attempts.
+    """
+    
+    MAX_ERRORS = 100
+    PROGRESS_INTERVAL = 100
+    ABORT_CHECK_INTERVAL = 30
+    ABORT_FAILURE_RATIO = 0.33
+    
+    def __init__(self, logger: Logger):
+        """
+        Initialize results tally.
+        
+        Args:
+            logger (Logger): Application logger instance
+        """
+        self.logger = logger
+        self.total = 0
+        self.sent = 0
+        self.failed = 0
+        self.errors = []
+        self.aborted = False
+        self._attempted = 0
+        self._delivery_failed = 0
+        self._lock = threading.Lock()
+    
+    def add_recipient(self) -> None:
+        """Count a recipient read from the CSV."""
+        with self._lock:
+            self.total += 1
+    
+    def record(self, recipient_email: str, error: str = None, attempted: bool = True) -> None:
+        """
+        Record the outcome for one recipient.
+        
+        Args:
+            recipient_email (str): Recipient email address
+            error (str, optional): Error message, None on success
+            attempted (bool): False if the message never reached the SMTP
+                server (invalid address, render error); such failures do
+                not count towards aborting the send
+        """
+        with self._lock:
+            if error is None:
+                self.sent += 1
+            else:
+                self.failed += 1
+                # Delivery failures were already logged by the sender
+                if not attempted:
+                    self.logger.error(f"Error sending to {recipient_email}: {error}")
+                if len(self.errors) < self.MAX_ERRORS:
+                    self.errors.append(f"Error sending to {recipient_email}: {error}")
+            
+            if attempted:
+                self._attempted += 1
+                self._delivery_failed += error is not None
+                self._check_failure_rate()
+            
+            # Progress logging
+            processed = self.sent + self.failed
+            if processed % self.PROGRESS_INTERVAL == 0:
+                self.logger.info(f"Progress: {processed}/{self.total} emails processed")
+    
+    def _check_failure_rate(self) -> None:
+        """Abort the send if too many delivery attempts are failing."""
+        if self.aborted or self._attempted % self.ABORT_CHECK_INTERVAL:
+            return
+        if self._delivery_failed / self._attempted > self.ABORT_FAILURE_RATIO:
+            self.aborted = True
+            self.logger.error(
+                f"Aborting bulk send - {self._delivery_failed} of "
+                f"{self._attempted} delivery attempts failed"
+            )
+    
+    def summary(self) -> Dict[str, Any]:
+        """Return the results dictionary."""
+        with self._lock:
+            return {
+                'total': self.total,
+                'sent': self.sent,
+                'failed': self.failed,
+                'errors': list(self.errors),
+                'aborted': self.aborted,
+                'success': self.failed == 0 and not self.aborted
+            }
+
+
+class SenderQueue(queue.Queue):
+    """
+    Bounded queue from one producer thread to a pool of sender threads.
+    
+    Senders only return on their None sentinel, so one that finishes early
+    has failed. The producer then stops instead of blocking forever on a
+    queue nobody drains, and raise_errors() re-raises the sender's exception.
+    """
+    
+    # Seconds the producer waits on a full queue before checking its senders
+    POLL_INTERVAL = 0.5
+    
+    def __init__(self, workers: int):
+        """
+        Initialize the queue.
+        
+        Args:
+            workers (int): Number of sender threads that will drain it
+        """
+        super().__init__(maxsize=workers * 2)
+        self.workers = workers
+        self.futures = []
+    
+    def start(self, executor: ThreadPoolExecutor, worker) -> None:
+        """Submit one worker per sender thread."""
+        self.futures = [executor.submit(worker) for _ in range(self.workers)]
+    
+    def senders_running(self) -> bool:
+        """Whether every sender thread is still draining the queue."""
+        return not any(future.done() for future in self.futures)
+    
+    def feed(self, item) -> bool:
+        """Queue an item; False once a sender has died and producing should stop."""
+        while self.senders_running():
+            try:
+                self.put(item, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def finish(self) -> None:
+        """Send every sender its sentinel, dropping unsent items if one has died."""
+        if not self.senders_running():
+            # Make room so the sentinels below cannot block
+            while True:
+                try:
+                    self.get_nowait()
+                except queue.Empty:
+                    break
+        for _ in range(self.workers):
+            self.put(None)
+    
+    def raise_errors(self) -> None:
+        """Re-raise the exception that stopped a sender thread, if any."""
+        for future in self.futures:
+            future.result()
+
+
 class EmailApplication:
     """
     Main application class that orchestrates all components.
@@ -703,12 +1984,21 @@ class EmailApplication:
         self.config = self.config_manager.load_config(config_file)
         
         # Initialize template renderer with config
-        template_dir = self.config.get('application', 'template_directory')
-        self.template_renderer = TemplateRenderer(self.logger, template_dir)
+        template_dir = self.config_manager.get('application', 'template_directory')
+        log_dir = self.config_manager.get('files', 'log_directory')
+        self.template_renderer = TemplateRenderer(
+            self.logger,
+            template_dir,
+            os.path.join(log_dir, '.jinja_cache') if log_dir else None
+        )
         
         # Update attachment handler max size
-        max_size = self.config.get('application', 'max_file_size_mb', 25)
+        max_size = self.config_manager.get('application', 'max_file_size_mb', 25)
         self.attachment_handler.max_size_bytes = max_size * 1024 * 1024
+        
+        # Per-domain send rate limits (messages per minute)
+        rate_limits = self.config_manager.get('application', 'rate_limits')
+        self.email_sender.rate_limiter = DomainRateLimiter(rate_limits) if rate_limits else None
     
     def send_test_email(self, test_recipient: str = None) -> bool:
         """
@@ -774,93 +2064,243 @@ Email Application
                         csv_file: str = None, 
                         template_file: str = None,
                         subject: str = None,
-                        attachments: List[str] = None) -> Dict[str, Any]:
+                        attachments: List[str] = None,
+                        concurrency: int = None) -> Dict[str, Any]:
         """
         Send bulk emails to recipients from CSV.
         
+        Messages are rendered on the calling thread and handed through a
+        bounded queue to a pool of workers, each owning its own SMTP session.
+        
+        Args:
+            csv_file (str, optional): Path to CSV file (uses config if None)
+            template_file (str, optional): Path to template file (uses config if None)
+            subject (str, optional): Email subject (uses config if None)
+            attachments (List[str], optional): List of attachment paths
+            concurrency (int, optional): Number of parallel SMTP sessions
+                (uses config if None, default 1)
+            
+        Returns:
+            Dict[str, Any]: Results summary
+        """
+        if not self.config:
+            raise EmailAppError("No configuration loaded")
+        
+        workers = self._bulk_concurrency(concurrency)
+        smtp_config = self.config['smtp']
+        attachment_count = len(attachments or [])
+        tally = BulkSendResults(self.logger)
+        
+        self.logger.info(f"Starting bulk email send using {workers} SMTP session(s)")
+        
+        def send_worker() -> None:
+            # Each worker drains the queue over its own persistent session
+            with self.email_sender.open_session(smtp_config) as smtp_conn:
+                while True:
+                    item = work_queue.get()
+                    if item is None:
+                        return
+                    if tally.aborted:
+                        continue
+                    recipient_email, personalized_subject, msg = item
+                    failures = self.email_sender.try_deliver_message(
+                        smtp_config, msg, [recipient_email],
+                        personalized_subject, attachment_count, smtp_conn
+                    )
+                    tally.record(recipient_email, failures.get(recipient_email))
+        
+        work_queue = SenderQueue(workers)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            work_queue.start(executor, send_worker)
+            
+            try:
+                for item in self._iter_bulk_messages(tally, csv_file, template_file,
+                                                     subject, attachments):
+                    # A dead worker stops production instead of blocking it
+                    if not work_queue.feed(item):
+                        break
+            finally:
+                # One sentinel per worker so every session shuts down cleanly
+                work_queue.finish()
+        
+        # Surface whatever stopped a worker instead of reporting a partial run
+        work_queue.raise_errors()
+        
+        return self._finish_bulk_send(tally)
+    
+    async def send_bulk_emails_async(self, 
+                                     csv_file: str = None, 
+                                     template_file: str = None,
+                                     subject: str = None,
+                                     attachments: List[str] = None,
+                                     concurrency: int = None) -> Dict[str, Any]:
+        """
+        Send bulk emails to recipients from CSV using asyncio and aiosmtplib.
+        
+        Same behaviour as send_bulk_emails, but the SMTP sessions are
+        coroutines multiplexed on one thread instead of worker threads.
+        
         Args:
             csv_file (str, optional): Path to CSV file (uses config if None)
             template_file (str, optional): Path to template file (uses config if None)
             subject (str, optional): Email subject (uses config if None)
             attachments (List[str], optional): List of attachment paths
+            concurrency (int, optional): Number of parallel SMTP sessions
+                (uses config if None, default 1)
             
         Returns:
             Dict[str, Any]: Results summary
+            
+        Raises:
+            EmailAppError: If aiosmtplib is not installed
         """
+        # Imported here: asyncio is only needed by this path and slows startup
+        import asyncio
+        
+        if not AIOSMTPLIB_AVAILABLE:
+            raise EmailAppError("Asynchronous sending requires aiosmtplib (pip install aiosmtplib)")
         if not self.config:
             raise EmailAppError("No configuration loaded")
         
+        workers = self._bulk_concurrency(concurrency)
+        smtp_config = self.config['smtp']
+        attachment_count = len(attachments or [])
+        tally = BulkSendResults(self.logger)
+        
+        self.logger.info(f"Starting async bulk email send using {workers} SMTP session(s)")
+        
+        async def send_worker() -> None:
+            smtp = None
+            try:
+                while True:
+                    item = await work_queue.get()
+                    if item is None:
+                        return
+                    if tally.aborted:
+                        continue
+                    recipient_email, personalized_subject, msg = item
+                    try:
+                        if smtp is None or not smtp.is_connected:
+                            smtp = await self.email_sender.open_async_connection(smtp_config)
+                        await self.email_sender.send_async_with_retry(smtp, msg, [recipient_email])
+                        self.logger.log_email_success(
+                            recipient_email, personalized_subject, attachment_count
+                        )
+                        tally.record(recipient_email)
+                    except Exception as e:
+                        self.logger.log_email_failure(recipient_email, str(e), personalized_subject)
+                        tally.record(recipient_email, str(e))
+            finally:
+                if smtp is not None and smtp.is_connected:
+                    try:
+                        await smtp.quit()
+                    except Exception:
+                        pass
+        
+        work_queue = asyncio.Queue(maxsize=workers * 2)
+        tasks = [asyncio.ensure_future(send_worker()) for _ in range(workers)]
+        
+        try:
+            for item in self._iter_bulk_messages(tally, csv_file, template_file,
+                                                 subject, attachments):
+                await work_queue.put(item)
+        finally:
+            for _ in tasks:
+                await work_queue.put(None)
+            await asyncio.gather(*tasks)
+        
+        return self._finish_bulk_send(tally)
+    
+    def _bulk_concurrency(self, concurrency: int = None) -> int:
+        """Resolve the number of parallel SMTP sessions for a bulk send."""
+        return max(1, concurrency or self.config.get('application', {}).get('concurrency', 1))
+    
+    def _iter_bulk_messages(self,
+                            tally: 'BulkSendResults',
+                            csv_file: str = None,
+                            template_file: str = None,
+                            subject: str = None,
+                            attachments: List[str] = None) -> Iterator[tuple]:
+        """
+        Render one ready-to-send message per CSV recipient.
+        
+        Recipients that cannot be rendered are recorded as failures in the
+        tally and skipped. Stops early if the tally aborts the send.
+        
+        Yields:
+            tuple: (recipient email, personalized subject, message)
+        """
         # Use config values as defaults
         csv_path = csv_file or self.config['files']['csv_recipients']
         template_path = template_file or self.config['files']['email_template']
         email_subject = subject or self.config['email']['default_subject']
+        smtp_config = self.config['smtp']
+        email_config = self.config['email']
         
-        # Read recipients
+        # Stream recipients; the total grows as rows are read
         self.logger.info("Reading recipient data from CSV...")
-        recipients = self.csv_reader.read_recipients(csv_path)
-        
-        # Initialize results tracking
-        results = {
-            'total': len(recipients),
-            'sent': 0,
-            'failed': 0,
-            'errors': [],
-            'success': False
-        }
+        recipients = self.csv_reader.iter_recipients(
+            csv_path,
+            self.config['files'].get('csv_delimiter')
+        )
         
-        smtp_config = self.config['smtp']
-        email_config = self.config['email']
+        # Body and subject are the same for every recipient - compile them once
+        body_template = self.template_renderer.get_template(template_path)
+        subject_template = self.template_renderer.compile_string(email_subject)
         
-        self.logger.info(f"Starting bulk email send to {results['total']} recipients")
+        # Sender and attachments are identical for every message - build them once
+        message_template = self.email_sender.build_message_template(
+            smtp_config['username'],
+            email_config.get('sender_name'),
+            self.email_sender.prepare_attachments(attachments)
+        )
         
-        # Send emails
-        for i, recipient_data in enumerate(recipients, 1):
+        # Bound methods used for every row
+        is_valid_email = self.csv_reader.is_valid_email
+        render = self.template_renderer.render_compiled
+        personalize = self.email_sender.personalize_message
+        log_sending = self.logger.log_email_sending
+        # Lives only for this run, so identical bodies share one encoded part
+        part_cache = {}
+        
+        for recipient_data in recipients:
+            if tally.aborted:
+                return
+            
+            tally.add_recipient()
+            recipient_email = recipient_data.get('email', 'unknown')
+            
+            # Reject malformed addresses without contacting the server
+            if not is_valid_email(recipient_email):
+                tally.record(recipient_email, "Invalid email address", attempted=False)
+                continue
+            
             try:
-                # Render template with recipient data
-                personalized_body = self.template_renderer.render_template(
-                    template_path, 
-                    recipient_data
-                )
-                
-                # Render subject with recipient data
-                if JINJA2_AVAILABLE:
-                    subject_template = Template(email_subject)
-                    personalized_subject = subject_template.render(**recipient_data)
-                else:
-                    personalized_subject = self.template_renderer._basic_template_replace(
-                        email_subject, 
-                        recipient_data
-                    )
+                # Render body and subject with recipient data
+                try:
+                    personalized_body = render(body_template, recipient_data)
+                except Exception as e:
+                    raise TemplateError(f"Template rendering error: {e}")
+                personalized_subject = render(subject_template, recipient_data)
                 
-                # Send email
-                success = self.email_sender.send_email(
-                    smtp_config=smtp_config,
-                    sender=smtp_config['username'],
-                    recipient=recipient_data['email'],
-                    subject=personalized_subject,
-                    body=personalized_body,
-                    attachments=attachments,
-                    sender_name=email_config.get('sender_name')
+                log_sending(recipient_email)
+                msg = personalize(
+                    message_template,
+                    [recipient_email],
+                    personalized_subject,
+                    personalized_body,
+                    part_cache=part_cache
                 )
-                
-                if success:
-                    results['sent'] += 1
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"Failed to send to {recipient_data['email']}")
-                
-                # Progress logging
-                if i % 10 == 0:
-                    self.logger.info(f"Progress: {i}/{results['total']} emails processed")
-                
             except Exception as e:
-                results['failed'] += 1
-                error_msg = f"Error sending to {recipient_data.get('email', 'unknown')}: {str(e)}"
-                results['errors'].append(error_msg)
-                self.logger.error(error_msg)
-        
-        # Final results
-        results['success'] = results['failed'] == 0
+                tally.record(recipient_email, str(e), attempted=False)
+                continue
+            
+            yield recipient_email, personalized_subject, msg
+    
+    def _finish_bulk_send(self, tally: 'BulkSendResults') -> Dict[str, Any]:
+        """Log the outcome of a bulk send and return its results summary."""
+        results = tally.summary()
         
         self.logger.info(f"Bulk email completed - Sent: {results['sent']}, Failed: {results['failed']}")
         
@@ -887,6 +2327,7 @@ def create_sample_config(output_file: str = "config.json") -> None:
         "files": {
             "_comment": "File paths for input and output",
             "csv_recipients": "./recipients.csv",
+            "csv_delimiter": ",",
             "email_template": "./template.txt",
             "output_directory": "./output",
             "log_directory": "./logs"
@@ -906,6 +2347,8 @@ def create_sample_config(output_file: str = "config.json") -> None:
             "max_attachments": 10,
             "max_file_size_mb": 25,
             "batch_size": 100,
+            "concurrency": 1,
+            "rate_limits": {},
             "template_directory": "./templates"
         }
     }
@@ -1003,6 +2446,15 @@ Examples:
                        nargs='*',
                        help='Attachment file paths')
     
+    parser.add_argument('--concurrency',
+                       type=int,
+                       help='Number of parallel SMTP sessions for bulk send (overrides config)')
+    
+    parser.add_argument('--async',
+                       dest='use_async',
+                       action='store_true',
+                       help='Send bulk emails with asyncio and aiosmtplib instead of threads')
+    
     parser.add_argument('--log-file',
                        help='Log file path (default: email_app.log)')
     
@@ -1030,6 +2482,11 @@ Examples:
         create_sample_config(args.create_config)
         return 0
     
+    # Show help if no action specified - no need to load config or log files
+    if not (args.test or args.send):
+        parser.print_help()
+        return 0
+    
     # Initialize application
     try:
         app = EmailApplication(
@@ -1054,32 +2511,36 @@ Examples:
             # Send bulk emails
             print("Sending bulk emails...")
             
-            results = app.send_bulk_emails(
+            bulk_args = dict(
                 csv_file=args.csv_file,
                 template_file=args.template_file,
                 subject=args.subject,
-                attachments=args.attachments
+                attachments=args.attachments,
+                concurrency=args.concurrency
             )
             
+            if args.use_async:
+                import asyncio
+                results = asyncio.run(app.send_bulk_emails_async(**bulk_args))
+            else:
+                results = app.send_bulk_emails(**bulk_args)
+            
             print(f"\nBulk Email Results:")
             print(f"  Total Recipients: {results['total']}")
             print(f"  Successfully Sent: {results['sent']}")
             print(f"  Failed: {results['failed']}")
             print(f"  Overall Success: {'✓' if results['success'] else '✗'}")
+            if results['aborted']:
+                print("  Aborted: too many delivery failures")
             
             if results['errors']:
                 print(f"\nErrors:")
                 for error in results['errors'][:5]:  # Show first 5 errors
                     print(f"  - {error}")
-                if len(results['errors']) > 5:
-                    print(f"  ... and {len(results['errors']) - 5} more errors")
+                if results['failed'] > 5:
+                    print(f"  ... and {results['failed'] - 5} more errors")
             
             return 0 if results['success'] else 1
-        
-        else:
-            # Show help if no action specified
-            parser.print_help()
-            return 0
             
     except EmailAppError as e:
         print(f"Application Error: {e}")
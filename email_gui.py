@@ -17,10 +17,16 @@ import sys
 import os
 import json
 import traceback
+import functools
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import re
+import time
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 
 # Set High DPI attributes BEFORE importing QtWidgets
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect
@@ -35,9 +41,9 @@ if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
 # Now import PyQt5 widgets
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QGridLayout, QLabel, QLineEdit, QPushButton, QTextEdit, 
+    QGridLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QPlainTextEdit,
     QComboBox, QSpinBox, QCheckBox, QFileDialog, QMessageBox,
-    QProgressBar, QGroupBox, QTableWidget, QTableWidgetItem,
+    QProgressBar, QGroupBox, QTableView,
     QHeaderView, QSplitter, QMenuBar, QAction, QStatusBar,
     QDialog, QDialogButtonBox, QFormLayout, QScrollArea, QFrame,
     QStackedWidget, QListWidget, QListWidgetItem, QCompleter, 
@@ -46,15 +52,23 @@ from PyQt5.QtWidgets import (
 
 from PyQt5.QtGui import QMovie, QTextCursor
 from PyQt5.QtGui import QFont, QIcon, QPixmap, QTextCursor as QTextCursor2, QPalette, QPainter, QColor, QDesktopServices
-from PyQt5.QtCore import QStringListModel, QUrl
+from PyQt5.QtCore import QStringListModel, QUrl, QAbstractTableModel, QModelIndex, QFileSystemWatcher, QSettings
 
 # Import our email application backend
 from email_app import (
     EmailApplication, ConfigurationManager, Logger,
     EmailAppError, ConfigurationError, EmailSendError,
-    CSVError, TemplateError
+    CSVError, CSVFileUnavailableError, TemplateError, BasicTemplate, BulkSendResults, CSVReader,
+    SenderQueue
 )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 
 # Enhanced Modern CSS Styling with Modern Dropdowns
 MODERN_STYLESHEET = """
@@ -126,6 +140,36 @@ QLabel#pageTitle {
     padding: 20px;
 }
 
+QLabel#recipientsCount {
+    color: #64748b;
+    font-weight: bold;
+}
+
+/* Page Container */
+QScrollArea#pageScroll {
+    border: none;
+    background: transparent;
+}
+
+/* Menu Bar */
+QMenuBar {
+    background-color: white;
+    color: #1e293b;
+    border-bottom: 1px solid #e2e8f0;
+    padding: 4px;
+}
+
+QMenuBar::item {
+    background: transparent;
+    padding: 8px 12px;
+    border-radius: 6px;
+    margin: 2px;
+}
+
+QMenuBar::item:selected {
+    background-color: #f1f5f9;
+}
+
 /* Card Styling */
 QFrame.card {
     background: white;
@@ -243,7 +287,7 @@ QComboBox QAbstractItemView::item:selected {
 }
 
 /* Loading Button Styling */
-QPushButton.loading {
+QPushButton[loading="true"] {
     background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
                                stop: 0 #6b7280, stop: 1 #4b5563) !important;
     color: white !important;
@@ -254,6 +298,37 @@ QPushButton.loading {
     font-weight: bold !important;
 }
 
+/* Attribute Dropdown Button */
+QPushButton[class="attributeDropdown"] {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                               stop: 0 #f8fafc, stop: 1 #e2e8f0);
+    border: 2px solid #d1d5db;
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 12px;
+    font-weight: 600;
+    color: #374151;
+    min-width: 140px;
+}
+
+QPushButton[class="attributeDropdown"]:hover {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                               stop: 0 #eff6ff, stop: 1 #dbeafe);
+    border-color: #3b82f6;
+    color: #1e40af;
+}
+
+QPushButton[class="attributeDropdown"]:pressed {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                               stop: 0 #dbeafe, stop: 1 #bfdbfe);
+}
+
+QPushButton[class="attributeDropdown"]:disabled {
+    background: #f1f5f9;
+    color: #9ca3af;
+    border-color: #e5e7eb;
+}
+
 /* Primary Buttons */
 QPushButton.primary {
     background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
@@ -432,6 +507,28 @@ QLabel.connection-status.disconnected {
     border-color: #475569;
 }
 
+/* Sidebar Connection Indicator */
+QLabel.connection-indicator {
+    color: white;
+    border-radius: 12px;
+    padding: 8px;
+    margin: 10px;
+    font-size: 12px;
+    font-weight: bold;
+}
+
+QLabel.connection-indicator.connected {
+    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                               stop: 0 #10b981, stop: 1 #047857);
+    border: 1px solid #047857;
+}
+
+QLabel.connection-indicator.disconnected {
+    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                               stop: 0 #64748b, stop: 1 #475569);
+    border: 1px solid #475569;
+}
+
 /* Checkboxes */
 QCheckBox {
     font-size: 14px;
@@ -453,7 +550,7 @@ QCheckBox::indicator:checked {
 }
 
 /* Tables */
-QTableWidget {
+QTableView {
     background: white;
     border: 1px solid #e2e8f0;
     border-radius: 8px;
@@ -461,12 +558,12 @@ QTableWidget {
     font-size: 13px;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 12px;
     border-bottom: 1px solid #f1f5f9;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background: #eff6ff;
     color: #1e40af;
 }
@@ -498,6 +595,31 @@ QProgressBar::chunk {
     border-radius: 10px;
 }
 
+/* Campaign Progress */
+QProgressBar#campaignProgress {
+    border-radius: 12px;
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                               stop: 0 #f1f5f9, stop: 1 #e2e8f0);
+    height: 24px;
+}
+
+QProgressBar#campaignProgress::chunk {
+    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                               stop: 0 #3b82f6, stop: 0.5 #60a5fa, stop: 1 #93c5fd);
+    border-radius: 12px;
+    margin: 2px;
+}
+
+QLabel#campaignStatus {
+    font-size: 14px;
+    color: #6b7280;
+    font-style: italic;
+    padding: 10px;
+    background: #f8fafc;
+    border-radius: 8px;
+    border: 1px solid #e2e8f0;
+}
+
 /* Dropdown Menu for Attributes */
 QMenu {
     background-color: white;
@@ -545,8 +667,9 @@ QFrame.stats-card:hover {
 }
 
 /* LOG DISPLAY - WHITE FONT */
-QTextEdit.log-display {
+QPlainTextEdit.log-display {
     background-color: #1e293b !important;
+    selection-background-color: #3b82f6;
     color: #ffffff !important;
     border: 1px solid #334155 !important;
     border-radius: 8px !important;
@@ -555,45 +678,145 @@ QTextEdit.log-display {
     font-size: 11px !important;
     line-height: 1.4 !important;
 }
+
+/* Stats Cards */
+QLabel.stats-icon {
+    font-size: 24px;
+    padding: 5px;
+}
+
+QLabel.stats-value {
+    font-size: 28px;
+    font-weight: bold;
+}
+
+QLabel.stats-title {
+    font-size: 14px;
+    font-weight: 500;
+    color: #6b7280;
+}
+
+QLabel.tone-blue { color: #3b82f6; }
+QLabel.tone-green { color: #10b981; }
+QLabel.tone-red { color: #ef4444; }
+QLabel.tone-amber { color: #f59e0b; }
+
+/* Page Section Headings */
+QLabel.section-title {
+    font-size: 18px;
+    font-weight: bold;
+    color: #1e293b;
+}
+
+QLabel.section-subtitle {
+    font-size: 14px;
+    color: #64748b;
+    margin-bottom: 15px;
+}
+
+QLabel.info-label {
+    color: #64748b;
+    font-style: italic;
+    margin-left: 10px;
+}
+
+QLabel.attributes-label {
+    color: #3b82f6;
+    font-weight: bold;
+    font-size: 13px;
+    margin: 10px 0;
+}
+
+/* Message Dialogs */
+QMessageBox.dialog {
+    background-color: white;
+    border-radius: 8px;
+    min-width: 350px;
+}
+
+QMessageBox.dialog QPushButton {
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-weight: bold;
+    min-width: 70px;
+}
+
+QMessageBox.dialog-error QPushButton { background-color: #ef4444; }
+QMessageBox.dialog-error QPushButton:hover { background-color: #dc2626; }
+QMessageBox.dialog-info QPushButton { background-color: #3b82f6; }
+QMessageBox.dialog-info QPushButton:hover { background-color: #2563eb; }
+QMessageBox.dialog-warning QPushButton { background-color: #f59e0b; }
+QMessageBox.dialog-warning QPushButton:hover { background-color: #d97706; }
+
+QMessageBox.dialog-about {
+    border-radius: 12px;
+    min-width: 600px;
+    min-height: 500px;
+}
+
+QMessageBox.dialog-about QPushButton {
+    padding: 12px 24px;
+    min-width: 100px;
+}
 """
 
 
 class LoadingButton(QPushButton):
     """Button with loading animation capability."""
     
+    LOADING_INTERVAL_MS = 500
+    
+    # One timer animates every loading button instead of one timer each
+    _shared_timer = None
+    _active = weakref.WeakSet()
+    
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self.original_text = text
-        self.original_class = ""
         self.is_loading = False
-        self.loading_timer = QTimer()
-        self.loading_timer.timeout.connect(self.update_loading_text)
         self.loading_dots = 0
     
+    @classmethod
+    def _tick(cls):
+        """Advance the dots on every loading button; stop when none remain."""
+        for button in list(cls._active):
+            button.update_loading_text()
+        if not cls._active:
+            cls._shared_timer.stop()
+    
     def start_loading(self, loading_text="Loading"):
         """Start loading animation."""
         if not self.is_loading:
             self.is_loading = True
-            self.original_class = self.property("class") or ""
             self.setEnabled(False)
-            self.setProperty("class", f"{self.original_class} loading")
-            self.style().unpolish(self)
-            self.style().polish(self)
+            self._set_loading_style(True)
             self.loading_text = loading_text
             self.loading_dots = 0
-            self.loading_timer.start(500)
             self.update_loading_text()
+            
+            if LoadingButton._shared_timer is None:
+                # Created on first use so it belongs to the running QApplication
+                LoadingButton._shared_timer = QTimer()
+                LoadingButton._shared_timer.timeout.connect(LoadingButton._tick)
+            LoadingButton._active.add(self)
+            if not LoadingButton._shared_timer.isActive():
+                LoadingButton._shared_timer.start(self.LOADING_INTERVAL_MS)
     
     def stop_loading(self):
         """Stop loading animation."""
         if self.is_loading:
             self.is_loading = False
-            self.loading_timer.stop()
+            LoadingButton._active.discard(self)
             self.setText(self.original_text)
             self.setEnabled(True)
-            self.setProperty("class", self.original_class)
-            self.style().unpolish(self)
-            self.style().polish(self)
+            self._set_loading_style(False)
+    
+    def _set_loading_style(self, loading):
+        """Toggle the loading selector; one polish restyles just this button."""
+        self.setProperty("loading", loading)
+        self.style().polish(self)
     
     def update_loading_text(self):
         """Update loading text with animated dots."""
@@ -610,6 +833,7 @@ class ModernAttributeDropdown(QWidget):
         super().__init__(parent)
         self.text_widget = text_widget
         self.csv_columns = csv_columns or []
+        self.attributes_menu = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -631,42 +855,21 @@ class ModernAttributeDropdown(QWidget):
         
         # Modern dropdown button with gradient
         self.dropdown_btn = QPushButton("📋 Select Attribute ▼")
-        self.dropdown_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #f8fafc, stop: 1 #e2e8f0);
-                border: 2px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 600;
-                color: #374151;
-                min-width: 140px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #eff6ff, stop: 1 #dbeafe);
-                border-color: #3b82f6;
-                color: #1e40af;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #dbeafe, stop: 1 #bfdbfe);
-            }
-            QPushButton:disabled {
-                background: #f1f5f9;
-                color: #9ca3af;
-                border-color: #e5e7eb;
-            }
-        """)
+        self.dropdown_btn.setProperty("class", "attributeDropdown")
         self.dropdown_btn.clicked.connect(self.show_attributes_menu)
         layout.addWidget(self.dropdown_btn)
         
         layout.addStretch()
         self.update_attributes(self.csv_columns)
     
-    def update_attributes(self, csv_columns):
-        """Update available attributes based on CSV columns."""
+    def update_attributes(self, csv_columns, attributes_menu=None):
+        """
+        Update available attributes based on CSV columns.
+        
+        Dropdowns over the same columns can share one menu built with
+        build_attributes_menu; the caller then owns it. Without one, the
+        dropdown builds and owns its own.
+        """
         self.csv_columns = csv_columns
         
         if csv_columns:
@@ -675,13 +878,18 @@ class ModernAttributeDropdown(QWidget):
         else:
             self.dropdown_btn.setText("📋 No Attributes Available")
             self.dropdown_btn.setEnabled(False)
-    
-    def show_attributes_menu(self):
-        """Show modern dropdown menu with available attributes."""
-        if not self.csv_columns:
-            return
         
-        menu = QMenu(self)
+        # Rebuilt only when the columns change; every click reuses it
+        if self.attributes_menu is not None and self.attributes_menu.parent() is self:
+            self.attributes_menu.deleteLater()
+        if attributes_menu is None and csv_columns:
+            attributes_menu = self.build_attributes_menu(csv_columns, self)
+        self.attributes_menu = attributes_menu if csv_columns else None
+    
+    @staticmethod
+    def build_attributes_menu(csv_columns, parent):
+        """Build the dropdown menu listing the given attributes."""
+        menu = QMenu(parent)
         menu.setStyleSheet("""
             QMenu {
                 background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
@@ -732,26 +940,34 @@ class ModernAttributeDropdown(QWidget):
         menu.addAction(header_action)
         menu.addSeparator()
         
-        # Add attributes
-        for column in self.csv_columns:
+        # Add attributes; the column rides on the action so any dropdown can read it back
+        for column in csv_columns:
             action = menu.addAction(f"📌 {{{{ {column} }}}}")
-            action.triggered.connect(lambda checked, col=column: self.insert_attribute(col))
+            action.setData(column)
+        
+        return menu
+    
+    def show_attributes_menu(self):
+        """Show modern dropdown menu with available attributes."""
+        if self.attributes_menu is None:
+            return
         
         # Show menu below the button
         button_rect = self.dropdown_btn.geometry()
         menu_pos = self.dropdown_btn.mapToGlobal(button_rect.bottomLeft())
-        menu.exec_(menu_pos)
+        
+        # exec_ returns the chosen action, so a shared menu inserts into this dropdown's field
+        action = self.attributes_menu.exec_(menu_pos)
+        if action is not None and action.data() is not None:
+            self.insert_attribute(action.data())
     
     def insert_attribute(self, column):
         """Insert selected attribute into text widget."""
         attribute_text = f"{{{{{column}}}}}"
         
         if isinstance(self.text_widget, QLineEdit):
-            current_text = self.text_widget.text()
-            cursor_pos = self.text_widget.cursorPosition()
-            new_text = current_text[:cursor_pos] + attribute_text + current_text[cursor_pos:]
-            self.text_widget.setText(new_text)
-            self.text_widget.setCursorPosition(cursor_pos + len(attribute_text))
+            # Inserts at the cursor (replacing any selection) and moves the cursor past it
+            self.text_widget.insert(attribute_text)
         elif isinstance(self.text_widget, QTextEdit):
             cursor = self.text_widget.textCursor()
             cursor.insertText(attribute_text)
@@ -796,15 +1012,15 @@ class EmailColumnSelector(QWidget):
         self.email_column_combo.clear()
         
         if columns:
-            # Auto-detect email column (more flexible detection)
-            email_candidates = [col for col in columns if 'email' in col.lower() or 'mail' in col.lower()]
+            # Auto-detect email column (more flexible detection); 'mail' also covers 'email'
+            email_column = next((col for col in columns if 'mail' in col.lower()), None)
             
             # Add all columns
             self.email_column_combo.addItems(columns)
             
             # Select email column if found, otherwise select first column
-            if email_candidates:
-                self.email_column_combo.setCurrentText(email_candidates[0])
+            if email_column is not None:
+                self.email_column_combo.setCurrentText(email_column)
             else:
                 # If no email-like column found, just select the first column
                 self.email_column_combo.setCurrentIndex(0)
@@ -819,16 +1035,27 @@ class EmailWorker(QThread):
     
     progress_updated = pyqtSignal(int, int)
     status_updated = pyqtSignal(str)
-    email_sent = pyqtSignal(str, bool, str)
+    # Batches of (recipient, success, error) sent with each progress update
+    emails_sent = pyqtSignal(list)
     finished = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     
+    # Progress is emitted every N sends or after this long, whichever comes first
+    PROGRESS_EMIT_EVERY = 50
+    PROGRESS_EMIT_SECONDS = 0.1
+    
+    # Recipients per message when sending an identical body as BCC batches
+    BCC_BATCH_SIZE = 50
+    
     def __init__(self, email_app: EmailApplication, operation: str, **kwargs):
         super().__init__()
         self.email_app = email_app
         self.operation = operation
         self.kwargs = kwargs
-        self.should_stop = False
+        self.stop_event = threading.Event()
+        self._pool = None
+        self._pending_sends = []
+        self._last_emit = 0.0
     
     def run(self):
         """Run the email operation in a separate thread."""
@@ -854,10 +1081,16 @@ class EmailWorker(QThread):
             self.error_occurred.emit(f"Test email error: {str(e)}")
     
     def _run_bulk_email(self):
-        """Run bulk email operation."""
+        """
+        Run bulk email operation.
+        
+        This thread renders and builds messages into a bounded queue while a
+        pool of sender threads, each holding one pooled SMTP session, sends them.
+        """
         try:
             self.status_updated.emit("Reading recipients...")
             recipients = self.kwargs.get('recipients_data', [])
+            email_column = self.kwargs.get('email_column', 'email')
             
             total = len(recipients)
             self.progress_updated.emit(0, total)
@@ -866,60 +1099,203 @@ class EmailWorker(QThread):
             template_content = self.kwargs.get('template_content', '')
             subject = self.kwargs.get('subject', 'Email from Application')
             attachments = self.kwargs.get('attachments', [])
+            concurrency = self.kwargs.get('concurrency') or \
+                self.email_app.config.get('application', {}).get('concurrency', 1)
+            workers = max(1, concurrency)
+            
+            # Shared with the CLI bulk send, including its abort on a high failure rate
+            tally = BulkSendResults(self.email_app.logger)
+            tally.total = total
+            progress_lock = threading.Lock()
+            
+            email_sender = self.email_app.email_sender
+            
+            # Sender threads borrow authenticated sessions instead of connecting per email
+            pool = self._pool = email_sender.session_pool(smtp_config)
             
-            results = {'total': total, 'sent': 0, 'failed': 0, 'errors': []}
+            # Attachments are read and base64-encoded once, then shared by every message
+            attachment_parts = email_sender.prepare_attachments(attachments)
+            message_template = email_sender.build_message_template(
+                smtp_config['username'], attachment_parts=attachment_parts)
+            # Identical bodies in a row share one encoded part, for this campaign only
+            part_cache = {}
             
-            for i, recipient_data in enumerate(recipients):
-                if self.should_stop:
-                    break
+            # Parse placeholders once; each render is then a single join
+            body_template = BasicTemplate(template_content)
+            subject_template = BasicTemplate(subject)
+            
+            # Bounded so rendering never runs far ahead of the network
+            work_queue = SenderQueue(workers)
+            
+            def send_worker():
+                # Sessions connect lazily, so borrowing one cannot fail here
+                with pool.session() as smtp_conn:
+                    while True:
+                        item = work_queue.get()
+                        if item is None:
+                            return
+                        if self.stop_event.is_set() or tally.aborted:
+                            continue
+                        
+                        # One address, or a whole BCC batch sharing one message
+                        emails, personalized_subject, msg = item
+                        failures = email_sender.try_deliver_message(
+                            smtp_config, msg, emails, personalized_subject,
+                            len(attachment_parts), smtp_conn
+                        )
+                        # Addresses the server refused fail on their own, not the whole batch
+                        for email in emails:
+                            self._record_send(tally, progress_lock, email, failures.get(email))
+            
+            self.status_updated.emit(f"Sending emails ({workers} at a time)...")
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                work_queue.start(executor, send_worker)
                 
                 try:
-                    self.progress_updated.emit(i + 1, total)
-                    self.status_updated.emit(f"Sending to {recipient_data.get('email', 'Unknown')}...")
-                    
-                    # Render template with recipient data
-                    personalized_body = self.render_template(template_content, recipient_data)
-                    personalized_subject = self.render_template(subject, recipient_data)
-                    
-                    success = self.email_app.email_sender.send_email(
-                        smtp_config=smtp_config,
-                        sender=smtp_config['username'],
-                        recipient=recipient_data.get('email'),
-                        subject=personalized_subject,
-                        body=personalized_body,
-                        attachments=attachments
-                    )
-                    
-                    if success:
-                        results['sent'] += 1
-                        self.email_sent.emit(recipient_data.get('email', 'Unknown'), True, "")
+                    # Identical messages go out BCC'd in batches, one SMTP transaction each
+                    if self.kwargs.get('bcc_batch') and body_template.is_static and subject_template.is_static:
+                        self._queue_bcc_batches(recipients, email_column, body_template.render(),
+                                                subject_template.render(), message_template,
+                                                smtp_config['username'], work_queue, tally, progress_lock)
                     else:
-                        results['failed'] += 1
-                        self.email_sent.emit(recipient_data.get('email', 'Unknown'), False, "Send failed")
-                        
-                except Exception as e:
-                    results['failed'] += 1
-                    error_msg = str(e)
-                    results['errors'].append(error_msg)
-                    self.email_sent.emit(recipient_data.get('email', 'Unknown'), False, error_msg)
+                        for recipient_data in recipients:
+                            if self.stop_event.is_set() or tally.aborted:
+                                break
+                            
+                            # The selected column becomes 'email' for this row only,
+                            # rather than copying the whole recipient list up front
+                            email = recipient_data.get(email_column, '')
+                            data = {**recipient_data, 'email': email}
+                            try:
+                                # Render template with recipient data
+                                personalized_body = body_template.render(**data)
+                                personalized_subject = subject_template.render(**data)
+                                msg = email_sender.personalize_message(
+                                    message_template, [email], personalized_subject, personalized_body,
+                                    part_cache=part_cache)
+                            except Exception as e:
+                                # Never reached the server, so it doesn't count towards aborting
+                                self._record_send(tally, progress_lock, email or 'Unknown', str(e), attempted=False)
+                                continue
+                            
+                            # A dead sender stops the campaign instead of hanging it
+                            if not work_queue.feed(([email], personalized_subject, msg)):
+                                break
+                finally:
+                    # One sentinel per sender so every thread returns its session
+                    work_queue.finish()
+            
+            # Report whatever stopped a sender thread as the campaign's error
+            work_queue.raise_errors()
             
-            results['success'] = results['failed'] == 0
-            self.finished.emit(results)
+            pool.close()
+            
+            if self._pending_sends:
+                self._emit_progress(tally)
+            
+            self.finished.emit(tally.summary())
             
         except Exception as e:
             self.error_occurred.emit(f"Bulk email error: {str(e)}")
     
-    def render_template(self, template_content, data):
-        """Simple template rendering with attribute replacement."""
-        rendered = template_content
-        for key, value in data.items():
-            placeholder = f"{{{{{key}}}}}"
-            rendered = rendered.replace(placeholder, str(value))
-        return rendered
+    def _queue_bcc_batches(self, recipients, email_column, body, subject, message_template,
+                           sender, work_queue, tally, progress_lock):
+        """Queue one message per BCC_BATCH_SIZE recipients, addressed only in the envelope."""
+        # The visible To is the sender, so recipients never see each other's addresses
+        msg = self.email_app.email_sender.personalize_message(message_template, [sender], subject, body)
+        batch = []
+        for recipient_data in recipients:
+            email = recipient_data.get(email_column, '')
+            if not email:
+                self._record_send(tally, progress_lock, 'Unknown', "No email address", attempted=False)
+                continue
+            # A malformed address could get the whole batch rejected
+            if not CSVReader.is_valid_email(email):
+                self._record_send(tally, progress_lock, email, "Invalid email address", attempted=False)
+                continue
+            batch.append(email)
+            if len(batch) == self.BCC_BATCH_SIZE:
+                if self.stop_event.is_set() or tally.aborted or not work_queue.feed((batch, subject, msg)):
+                    return
+                batch = []
+        if batch and not (self.stop_event.is_set() or tally.aborted):
+            work_queue.feed((batch, subject, msg))
+    
+    def _emit_progress(self, tally):
+        """Report the pending batch of sends and the absolute processed count."""
+        batch, self._pending_sends = self._pending_sends, []
+        self.emails_sent.emit(batch)
+        self.progress_updated.emit(tally.sent + tally.failed, tally.total)
+    
+    def _record_send(self, tally, progress_lock, email, error=None, attempted=True):
+        """Count one send and report it; called from the sender threads."""
+        with progress_lock:
+            tally.record(email, error, attempted)
+            
+            # Emitting under the lock keeps progress updates in order;
+            # Qt queues the signals to the UI thread
+            self._pending_sends.append((email or 'Unknown', error is None, error or ""))
+            now = time.monotonic()
+            if len(self._pending_sends) >= self.PROGRESS_EMIT_EVERY or \
+                    now - self._last_emit > self.PROGRESS_EMIT_SECONDS:
+                self._emit_progress(tally)
+                self._last_emit = now
     
     def stop(self):
         """Stop the email operation."""
-        self.should_stop = True
+        self.stop_event.set()
+        # Sends blocked on the network fail now rather than at the SMTP timeout
+        pool = self._pool
+        if pool is not None:
+            pool.abort()
+
+
+class CSVLoader(QThread):
+    """Reads a recipients CSV off the UI thread."""
+    
+    loaded = pyqtSignal(list)
+    failed = pyqtSignal(str, bool)
+    
+    # Errors expected while an editor is replacing the file; the next save fixes them
+    TRANSIENT_ERRORS = (CSVFileUnavailableError, FileNotFoundError, PermissionError)
+    
+    def __init__(self, csv_reader, csv_file: str, delimiter: str = None, parent=None):
+        super().__init__(parent)
+        self.csv_reader = csv_reader
+        self.csv_file = csv_file
+        self.delimiter = delimiter
+    
+    def run(self):
+        """Read the file and report the recipients, or the error and whether it is transient."""
+        try:
+            self.loaded.emit(self.csv_reader.read_recipients(self.csv_file, self.delimiter))
+        except Exception as e:
+            self.failed.emit(str(e), isinstance(e, self.TRANSIENT_ERRORS))
+
+
+class FileWriter(QThread):
+    """Writes a text file off the UI thread."""
+    
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    
+    # Large buffer so multi-megabyte exports go out in a few writes
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    def __init__(self, file_path: str, content: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.content = content
+    
+    def run(self):
+        """Write the content and report the path or the error."""
+        try:
+            with open(self.file_path, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+                f.write(self.content)
+            self.saved.emit(self.file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class ModernCard(QFrame):
@@ -964,6 +1340,14 @@ class ModernCard(QFrame):
 class StatsCard(QFrame):
     """Statistics card widget for campaign display."""
     
+    # Card colors with a matching tone class in MODERN_STYLESHEET
+    COLOR_TONES = {
+        "#3b82f6": "tone-blue",
+        "#10b981": "tone-green",
+        "#ef4444": "tone-red",
+        "#f59e0b": "tone-amber",
+    }
+    
     def __init__(self, title: str, value: str, icon: str = "📊", color: str = "#3b82f6", parent=None):
         super().__init__(parent)
         self.setProperty("class", "stats-card")
@@ -980,55 +1364,96 @@ class StatsCard(QFrame):
         top_row = QHBoxLayout()
         
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet(f"""
-            font-size: 24px;
-            color: {color};
-            padding: 5px;
-        """)
+        self.set_tone(icon_label, "stats-icon", color)
         top_row.addWidget(icon_label)
         
         top_row.addStretch()
         
-        value_label = QLabel(value)
-        value_label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: bold;
-            color: {color};
-        """)
-        value_label.setAlignment(Qt.AlignRight)
-        top_row.addWidget(value_label)
+        self.value_label = QLabel(value)
+        self.set_tone(self.value_label, "stats-value", color)
+        self.value_label.setAlignment(Qt.AlignRight)
+        top_row.addWidget(self.value_label)
         
         layout.addLayout(top_row)
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 500;
-            color: #6b7280;
-        """)
+        title_label.setProperty("class", "stats-title")
         layout.addWidget(title_label)
     
+    @classmethod
+    def set_tone(cls, label: QLabel, style_class: str, color: str):
+        """Style a label from the global sheet, inlining only colors it has no class for."""
+        tone = cls.COLOR_TONES.get(color.lower())
+        if tone:
+            label.setProperty("class", f"{style_class} {tone}")
+        else:
+            label.setProperty("class", style_class)
+            label.setStyleSheet(f"color: {color};")
+    
     def update_value(self, value: str):
         """Update the stats value."""
-        # Find value label and update it
-        for i in range(self.layout().count()):
-            item = self.layout().itemAt(i)
-            if isinstance(item, QHBoxLayout):
-                for j in range(item.count()):
-                    widget = item.itemAt(j).widget()
-                    if isinstance(widget, QLabel) and "font-size: 28px" in widget.styleSheet():
-                        widget.setText(value)
-                        break
-
-
-class SetupPage(QWidget):
-    """Setup page for configuring email account and CSV file."""
+        self.value_label.setText(value)
+
+
+class LazyPage(QWidget):
+    """
+    Page that builds its widgets when first shown.
+    
+    Public methods that need the widgets before then call ensure_built();
+    ones that only hand the page data keep it until setup_ui runs.
+    """
     
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
-        self.setup_ui()
+        self._built = False
+    
+    def setup_ui(self):
+        """Create the page's widgets; implemented by each page."""
+        raise NotImplementedError
+    
+    def ensure_built(self):
+        """Run setup_ui once, if it has not run yet."""
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+    
+    def showEvent(self, event):
+        """Build the page just before it is first displayed."""
+        self.ensure_built()
+        super().showEvent(event)
+
+
+class SetupPage(LazyPage):
+    """Setup page for configuring email account and CSV file."""
+    
+    # SMTP configurations for different providers
+    PROVIDER_SMTP = {
+        "Gmail": {"server": "smtp.gmail.com", "port": 587, "tls": True, "ssl": False},
+        "Outlook": {"server": "smtp-mail.outlook.com", "port": 587, "tls": True, "ssl": False},
+        "Yahoo": {"server": "smtp.mail.yahoo.com", "port": 587, "tls": True, "ssl": False},
+        "iCloud": {"server": "smtp.mail.me.com", "port": 587, "tls": True, "ssl": False},
+        "Custom": {"server": "", "port": 587, "tls": True, "ssl": False}
+    }
+    
+    # Upper bound for parallel SMTP connections; providers throttle beyond a few
+    MAX_CONCURRENCY = 8
+    
+    # Password visibility icons by emoji, rendered once per process
+    _visibility_icons = {}
+    
+    # (email, password) placeholder texts per provider
+    PROVIDER_PLACEHOLDERS = {
+        "Gmail": ("your.email@gmail.com", "Use App Password for Gmail"),
+        "Outlook": ("your.email@outlook.com", "Your Outlook password"),
+        "Yahoo": ("your.email@yahoo.com", "Your Yahoo password"),
+        "iCloud": ("your.email@icloud.com", "Your iCloud password"),
+        "Custom": ("your.email@domain.com", "Your email password")
+    }
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
     
     def setup_ui(self):
         """Setup the account and file configuration interface."""
@@ -1089,55 +1514,19 @@ class SetupPage(QWidget):
         password_label.setMinimumWidth(80)
         password_row.addWidget(password_label)
         
-        # Password container that looks like other input fields
-        password_container = QFrame()
-        password_container.setMinimumHeight(45)
-        password_container.setStyleSheet("""
-            QFrame {
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                background: white;
-                padding: 0px;
-            }
-            QFrame:focus-within {
-                border-color: #3b82f6;
-            }
-        """)
-        password_container_layout = QHBoxLayout()
-        password_container_layout.setContentsMargins(12, 0, 0, 0)
-        password_container_layout.setSpacing(0)
-        
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.Password)
         self.password_edit.setPlaceholderText("Your email password or app password")
-        self.password_edit.setStyleSheet("QLineEdit { border: none; background: transparent; padding: 8px 0; }")
-        password_container_layout.addWidget(self.password_edit)
-        
-        # Password visibility toggle button
-        self.password_eye_btn = QPushButton("👁️")
-        self.password_eye_btn.setFixedSize(50, 35)
-        self.password_eye_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background: transparent;
-                color: #6b7280;
-                font-size: 16px;
-                margin-right: 8px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                color: #374151;
-                background: #e5e7eb;
-            }
-            QPushButton:pressed {
-                background: #d1d5db;
-            }
-        """)
-        self.password_eye_btn.clicked.connect(self.toggle_password_visibility)
-        password_container_layout.addWidget(self.password_eye_btn)
+        # Drop the reference when Qt deletes the widget, e.g. while the window closes
+        self.password_edit.destroyed.connect(lambda: setattr(self, 'password_edit', None))
         
-        password_container.setLayout(password_container_layout)
-        password_row.addWidget(password_container)
+        # Password visibility toggle, drawn inside the field as a trailing action
+        self.password_eye_action = self.password_edit.addAction(
+            self.visibility_icon("👁️"), QLineEdit.TrailingPosition
+        )
+        self.password_eye_action.setToolTip("Show password")
+        self.password_eye_action.triggered.connect(self.toggle_password_visibility)
+        password_row.addWidget(self.password_edit)
         
         # Test connection button
         self.test_btn = LoadingButton("🔗 Test Connection")
@@ -1178,6 +1567,17 @@ class SetupPage(QWidget):
         self.ssl_check = QCheckBox("SSL")
         advanced_layout.addWidget(self.ssl_check)
         
+        connections_label = QLabel("Connections:")
+        advanced_layout.addWidget(connections_label)
+        
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, self.MAX_CONCURRENCY)
+        self.concurrency_spin.setValue(1)
+        self.concurrency_spin.setFixedWidth(60)
+        self.concurrency_spin.setMinimumHeight(40)
+        self.concurrency_spin.setToolTip("Parallel SMTP connections used for bulk sending")
+        advanced_layout.addWidget(self.concurrency_spin)
+        
         account_layout.addLayout(creds_layout)
         account_layout.addLayout(advanced_layout)
         
@@ -1196,6 +1596,7 @@ class SetupPage(QWidget):
         
         self.csv_file_edit = QLineEdit()
         self.csv_file_edit.setPlaceholderText("Select your recipients CSV file...")
+        self.csv_file_edit.editingFinished.connect(self.on_csv_path_edited)
         csv_layout.addWidget(self.csv_file_edit)
         
         self.csv_browse_btn = LoadingButton("📂 Browse")
@@ -1215,46 +1616,48 @@ class SetupPage(QWidget):
     
     def on_provider_changed(self, provider):
         """Handle email provider selection change."""
-        # SMTP configurations for different providers
-        providers = {
-            "Gmail": {"server": "smtp.gmail.com", "port": 587, "tls": True, "ssl": False},
-            "Outlook": {"server": "smtp-mail.outlook.com", "port": 587, "tls": True, "ssl": False},
-            "Yahoo": {"server": "smtp.mail.yahoo.com", "port": 587, "tls": True, "ssl": False},
-            "iCloud": {"server": "smtp.mail.me.com", "port": 587, "tls": True, "ssl": False},
-            "Custom": {"server": "", "port": 587, "tls": True, "ssl": False}
-        }
-        
-        config = providers.get(provider, providers["Custom"])
+        config = self.PROVIDER_SMTP.get(provider, self.PROVIDER_SMTP["Custom"])
         self.smtp_server_edit.setText(config["server"])
         self.smtp_port_spin.setValue(config["port"])
         self.tls_check.setChecked(config["tls"])
         self.ssl_check.setChecked(config["ssl"])
         
         # Update placeholder texts based on provider
-        placeholders = {
-            "Gmail": ("your.email@gmail.com", "Use App Password for Gmail"),
-            "Outlook": ("your.email@outlook.com", "Your Outlook password"),
-            "Yahoo": ("your.email@yahoo.com", "Your Yahoo password"), 
-            "iCloud": ("your.email@icloud.com", "Your iCloud password"),
-            "Custom": ("your.email@domain.com", "Your email password")
-        }
-        
-        email_placeholder, pass_placeholder = placeholders.get(provider, placeholders["Custom"])
+        email_placeholder, pass_placeholder = self.PROVIDER_PLACEHOLDERS.get(
+            provider, self.PROVIDER_PLACEHOLDERS["Custom"]
+        )
         self.email_edit.setPlaceholderText(email_placeholder)
         self.password_edit.setPlaceholderText(pass_placeholder)
     
     def toggle_password_visibility(self):
         """Toggle password field visibility between hidden and visible."""
-        try:
-            if hasattr(self, 'password_edit') and self.password_edit:
-                if self.password_edit.echoMode() == QLineEdit.Password:
-                    self.password_edit.setEchoMode(QLineEdit.Normal)
-                    self.password_eye_btn.setText("🙈")
-                else:
-                    self.password_edit.setEchoMode(QLineEdit.Password)
-                    self.password_eye_btn.setText("👁️")
-        except:
-            pass
+        password_edit = self.password_edit
+        if password_edit is None:
+            return
+        if password_edit.echoMode() == QLineEdit.Password:
+            password_edit.setEchoMode(QLineEdit.Normal)
+            self.password_eye_action.setIcon(self.visibility_icon("🙈"))
+            self.password_eye_action.setToolTip("Hide password")
+        else:
+            password_edit.setEchoMode(QLineEdit.Password)
+            self.password_eye_action.setIcon(self.visibility_icon("👁️"))
+            self.password_eye_action.setToolTip("Show password")
+    
+    @classmethod
+    def visibility_icon(cls, emoji):
+        """Return the emoji rendered as an icon, drawing it only the first time."""
+        icon = cls._visibility_icons.get(emoji)
+        if icon is None:
+            pixmap = QPixmap(24, 24)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            font = painter.font()
+            font.setPixelSize(18)
+            painter.setFont(font)
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, emoji)
+            painter.end()
+            icon = cls._visibility_icons[emoji] = QIcon(pixmap)
+        return icon
     
     def test_connection(self):
         """Test SMTP connection with loading animation."""
@@ -1276,8 +1679,16 @@ class SetupPage(QWidget):
             if self.main_window:
                 self.main_window.on_files_changed()
     
+    def on_csv_path_edited(self):
+        """Reload recipients after a CSV path is typed in by hand."""
+        # isModified is only set by typing, not by setText from browse or config load
+        if self.csv_file_edit.isModified() and self.main_window:
+            self.csv_file_edit.setModified(False)
+            self.main_window.on_files_changed()
+    
     def update_connection_status(self, connected: bool, message: str = ""):
         """Update the connection status indicator."""
+        self.ensure_built()
         if connected:
             self.connection_status.setText("🟢 Connected")
             self.connection_status.setProperty("class", "connection-status connected")
@@ -1285,8 +1696,7 @@ class SetupPage(QWidget):
             self.connection_status.setText("🔴 Disconnected")
             self.connection_status.setProperty("class", "connection-status disconnected")
         
-        # Apply style changes
-        self.connection_status.style().unpolish(self.connection_status)
+        # Rules for both states are in MODERN_STYLESHEET; one polish re-matches them
         self.connection_status.style().polish(self.connection_status)
         self.test_btn.stop_loading()
         
@@ -1299,13 +1709,10 @@ class SetupPage(QWidget):
     
     def get_config(self):
         """Get current configuration settings."""
-        # Safe password access to prevent widget deletion errors
-        password_text = ""
-        try:
-            if hasattr(self, 'password_edit') and self.password_edit:
-                password_text = self.password_edit.text()
-        except:
-            password_text = ""
+        self.ensure_built()
+        # The password field is None once Qt has deleted it
+        password_edit = self.password_edit
+        password_text = password_edit.text() if password_edit is not None else ""
         
         return {
             'smtp': {
@@ -1322,37 +1729,150 @@ class SetupPage(QWidget):
             },
             'email': {
                 'test_email': self.email_edit.text()
+            },
+            'application': {
+                'concurrency': self.concurrency_spin.value()
             }
         }
     
     def set_config(self, config):
         """Set configuration settings in the UI."""
+        self.ensure_built()
         smtp_config = config.get('smtp', {})
         self.smtp_server_edit.setText(smtp_config.get('server', ''))
         self.smtp_port_spin.setValue(smtp_config.get('port', 587))
         self.email_edit.setText(smtp_config.get('username', ''))
         
-        # Safe password setting to prevent widget deletion errors
-        try:
-            if hasattr(self, 'password_edit') and self.password_edit:
-                self.password_edit.setText(smtp_config.get('password', ''))
-        except:
-            pass
+        # The password field is None once Qt has deleted it
+        if self.password_edit is not None:
+            self.password_edit.setText(smtp_config.get('password', ''))
         
         self.tls_check.setChecked(smtp_config.get('use_tls', True))
         self.ssl_check.setChecked(smtp_config.get('use_ssl', False))
         
         files_config = config.get('files', {})
         self.csv_file_edit.setText(files_config.get('csv_recipients', ''))
+        
+        app_config = config.get('application', {})
+        self.concurrency_spin.setValue(app_config.get('concurrency', 1))
+    
+    def csv_file_path(self):
+        """Get the recipients CSV path entered on the page."""
+        self.ensure_built()
+        return self.csv_file_edit.text()
+
+
+class RecipientsTableModel(QAbstractTableModel):
+    """Read-only model over the recipient rows; the view fetches only the cells it paints."""
+    
+    def __init__(self, recipients_data=None, columns=None, parent=None):
+        super().__init__(parent)
+        self.recipients_data = recipients_data or []
+        self.columns = columns or []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of recipients."""
+        return 0 if parent.isValid() else len(self.recipients_data)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of CSV columns."""
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text, centered."""
+        if role == Qt.DisplayRole and index.isValid():
+            recipient = self.recipients_data[index.row()]
+            return str(recipient.get(self.columns[index.column()], ''))
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column names as horizontal headers."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_recipients(self, recipients_data, columns):
+        """Replace the rows and columns shown by the view."""
+        self.beginResetModel()
+        self.recipients_data = recipients_data
+        self.columns = columns
+        self.endResetModel()
+
+
+class AttachmentsTableModel(QAbstractTableModel):
+    """Read-only model over the attached files: name and formatted size, keyed by path."""
+    
+    HEADERS = ["📁 File", "📏 Size"]
+    ROLES = frozenset((Qt.DisplayRole, Qt.TextAlignmentRole, Qt.UserRole))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (file_path, file_name, size_str) per attachment
+        self.attachments = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of attachments."""
+        return 0 if parent.isValid() else len(self.attachments)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """File name and size."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text, centered; the full path under Qt.UserRole."""
+        # Qt asks for every role on each paint; answer the unused ones first
+        if role not in self.ROLES or not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        file_path, file_name, size_str = self.attachments[index.row()]
+        if role == Qt.UserRole:
+            return file_path
+        return file_name if index.column() == 0 else size_str
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles as horizontal headers."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def add_attachments(self, attachments):
+        """Append (file_path, file_name, size_str) rows in one insertion."""
+        if not attachments:
+            return
+        first = len(self.attachments)
+        self.beginInsertRows(QModelIndex(), first, first + len(attachments) - 1)
+        self.attachments.extend(attachments)
+        self.endInsertRows()
+    
+    def remove_attachment(self, row):
+        """Remove the attachment at a row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.attachments[row]
+        self.endRemoveRows()
+    
+    def clear(self):
+        """Remove all attachments."""
+        self.beginResetModel()
+        self.attachments = []
+        self.endResetModel()
+    
+    def file_paths(self):
+        """Full paths of the attached files, in display order."""
+        return [file_path for file_path, _, _ in self.attachments]
 
 
-class RecipientsPage(QWidget):
+class RecipientsPage(LazyPage):
     """Recipients preview page with email column selection and centered content."""
     
+    # Rows measured when sizing columns to their content
+    RESIZE_SAMPLE_ROWS = 50
+    
     def __init__(self, main_window):
-        super().__init__()
-        self.main_window = main_window
-        self.setup_ui()
+        super().__init__(main_window)
+        self._recipients = ([], "")
     
     def setup_ui(self):
         """Setup the recipients preview interface with centered content."""
@@ -1370,13 +1890,13 @@ class RecipientsPage(QWidget):
         
         # Centered title
         title_label = QLabel("👥 Recipients Preview")
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #1e293b; text-align: center;")
+        title_label.setProperty("class", "section-title")
         title_label.setAlignment(Qt.AlignCenter)
         recipients_layout.addWidget(title_label)
         
         # Centered subtitle
         subtitle_label = QLabel("Review your email recipients and select email column")
-        subtitle_label.setStyleSheet("font-size: 14px; color: #64748b; text-align: center; margin-bottom: 15px;")
+        subtitle_label.setProperty("class", "section-subtitle")
         subtitle_label.setAlignment(Qt.AlignCenter)
         recipients_layout.addWidget(subtitle_label)
         
@@ -1390,7 +1910,7 @@ class RecipientsPage(QWidget):
         controls_layout.addWidget(self.refresh_btn)
         
         self.recipients_info_label = QLabel("No recipients loaded")
-        self.recipients_info_label.setStyleSheet("color: #64748b; font-style: italic; margin-left: 10px;")
+        self.recipients_info_label.setProperty("class", "info-label")
         controls_layout.addWidget(self.recipients_info_label)
         
         # Email column selector
@@ -1401,20 +1921,27 @@ class RecipientsPage(QWidget):
         
         # Available attributes display - centered
         self.attributes_label = QLabel("Available attributes: None")
-        self.attributes_label.setStyleSheet("color: #3b82f6; font-weight: bold; font-size: 13px; margin: 10px 0; text-align: center;")
+        self.attributes_label.setProperty("class", "attributes-label")
         self.attributes_label.setAlignment(Qt.AlignCenter)
         recipients_layout.addWidget(self.attributes_label)
         
         # Recipients table with auto-sizing and height expansion
-        self.recipients_table = QTableWidget()
+        self.recipients_model = RecipientsTableModel(parent=self)
+        self.recipients_table = QTableView()
+        self.recipients_table.setModel(self.recipients_model)
         self.recipients_table.setAlternatingRowColors(True)
-        self.recipients_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.recipients_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Fixed row heights, so the view never asks rows for a size hint
+        self.recipients_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.recipients_table.setSelectionBehavior(QTableView.SelectRows)
+        self.recipients_table.setEditTriggers(QTableView.NoEditTriggers)
         self.recipients_table.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
         self.recipients_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.recipients_table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        # Auto-resize columns to content
-        self.recipients_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Columns are sized to their content once per load in update_recipients, measuring
+        # a sample of rows; ResizeToContents would re-measure on every layout change
+        # and ignore the widths set to fit the card
+        self.recipients_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.recipients_table.horizontalHeader().setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         # Don't stretch last column to prevent overflow
         self.recipients_table.horizontalHeader().setStretchLastSection(False)
         
@@ -1422,6 +1949,9 @@ class RecipientsPage(QWidget):
         
         recipients_card.add_content(recipients_content)
         main_layout.addWidget(recipients_card)
+        
+        if self._recipients[0]:
+            self.update_recipients(*self._recipients)
     
     def refresh_recipients(self):
         """Refresh recipients data with loading animation."""
@@ -1431,13 +1961,16 @@ class RecipientsPage(QWidget):
     
     def update_recipients(self, recipients_data, csv_file_name=""):
         """Update recipients display with auto-sizing columns and centered content."""
+        # Kept until the page is built so CSV loads don't build it early
+        self._recipients = (recipients_data, csv_file_name)
+        if not self._built:
+            return
         self.refresh_btn.stop_loading()
         
         if not recipients_data:
             self.recipients_info_label.setText("No recipients loaded")
             self.attributes_label.setText("Available attributes: None")
-            self.recipients_table.setRowCount(0)
-            self.recipients_table.setColumnCount(0)
+            self.recipients_model.set_recipients([], [])
             self.email_column_selector.update_columns([])
             return
         
@@ -1456,46 +1989,46 @@ class RecipientsPage(QWidget):
             attr_text = ", ".join([f"{{{{ {col} }}}}" for col in columns])
             self.attributes_label.setText(f"Available attributes: {attr_text}")
             
-            # Update table
-            self.recipients_table.setColumnCount(len(columns))
-            self.recipients_table.setHorizontalHeaderLabels(columns)
-            self.recipients_table.setRowCount(len(recipients_data))
-            
-            for row, recipient in enumerate(recipients_data):
-                for col, header in enumerate(columns):
-                    item = QTableWidgetItem(str(recipient.get(header, '')))
-                    item.setTextAlignment(Qt.AlignCenter)
-                    self.recipients_table.setItem(row, col, item)
-            
-            # Auto-resize columns to fit content
-            self.recipients_table.resizeColumnsToContents()
-            
-            # Ensure table doesn't exceed card width
-            header = self.recipients_table.horizontalHeader()
-            total_width = sum(self.recipients_table.columnWidth(i) for i in range(len(columns)))
-            available_width = self.recipients_table.parent().width() - 60
+            # Update table; cells are read from the rows as they are painted
+            self.recipients_model.set_recipients(recipients_data, columns)
             
-            if total_width > available_width:
-                # Scale down columns proportionally
-                scale_factor = available_width / total_width
-                for col in range(len(columns)):
-                    current_width = self.recipients_table.columnWidth(col)
-                    new_width = int(current_width * scale_factor)
-                    self.recipients_table.setColumnWidth(col, max(new_width, 80))
+            # Measure on the next event loop pass so loading returns to the UI at once
+            QTimer.singleShot(0, self.fit_recipient_columns)
+    
+    def fit_recipient_columns(self):
+        """Size columns to their sampled content, scaled down to fit the card."""
+        table = self.recipients_table
+        
+        # Auto-resize columns to fit content
+        table.resizeColumnsToContents()
+        
+        # Ensure table doesn't exceed card width
+        widths = [table.columnWidth(col) for col in range(self.recipients_model.columnCount())]
+        total_width = sum(widths)
+        available_width = table.parentWidget().width() - 60
+        
+        if total_width > available_width:
+            # Scale down columns proportionally
+            scale_factor = available_width / total_width
+            for col, current_width in enumerate(widths):
+                new_width = int(current_width * scale_factor)
+                table.setColumnWidth(col, max(new_width, 80))
     
     def get_selected_email_column(self):
         """Get the selected email column name."""
+        self.ensure_built()
         return self.email_column_selector.get_selected_column()
 
 
-class ComposePage(QWidget):
+class ComposePage(LazyPage):
     """Email composition page with centered content and modern dropdowns."""
     
+    SIZE_UNITS = ("B", "KB", "MB", "GB")
+    
     def __init__(self, main_window):
-        super().__init__()
-        self.main_window = main_window
+        super().__init__(main_window)
         self.csv_columns = []
-        self.setup_ui()
+        self.attributes_menu = None
     
     def setup_ui(self):
         """Setup the email composition interface with centered content."""
@@ -1519,7 +2052,7 @@ class ComposePage(QWidget):
         subject_layout.addWidget(self.subject_edit)
         
                 # Subject attributes dropdown
-        self.subject_attributes = ModernAttributeDropdown(self.subject_edit, self.csv_columns)
+        self.subject_attributes = ModernAttributeDropdown(self.subject_edit)
         subject_layout.addWidget(self.subject_attributes)
         
         compose_layout.addLayout(subject_layout)
@@ -1547,11 +2080,16 @@ The Team""")
         content_layout.addWidget(self.email_content_edit)
         
         # Content attributes dropdown
-        self.content_attributes = ModernAttributeDropdown(self.email_content_edit, self.csv_columns)
+        self.content_attributes = ModernAttributeDropdown(self.email_content_edit)
         content_layout.addWidget(self.content_attributes)
         
         compose_layout.addLayout(content_layout)
         
+        self.bcc_batch_check = QCheckBox("Send as BCC batches when subject and content have no attributes")
+        self.bcc_batch_check.setToolTip(
+            "Identical emails are sent to up to 50 recipients at a time, addressed as BCC")
+        compose_layout.addWidget(self.bcc_batch_check)
+        
         compose_card.add_content(compose_content)
         main_layout.addWidget(compose_card)
         
@@ -1563,13 +2101,13 @@ The Team""")
 
         # Left-aligned title
         attach_title = QLabel("📎 Attachments")
-        attach_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #1e293b;")
+        attach_title.setProperty("class", "section-title")
         attach_title.setAlignment(Qt.AlignLeft)  # Changed to left
         attachments_layout.addWidget(attach_title)
 
         # Left-aligned subtitle
         attach_subtitle = QLabel("Add files to your email campaign")
-        attach_subtitle.setStyleSheet("font-size: 14px; color: #64748b; margin-bottom: 15px;")
+        attach_subtitle.setProperty("class", "section-subtitle")
         attach_subtitle.setAlignment(Qt.AlignLeft)  # Changed to left
         attachments_layout.addWidget(attach_subtitle)
 
@@ -1594,17 +2132,18 @@ The Team""")
         attachments_layout.addLayout(attach_controls)
         
         # Attachments table with full width and proportional columns
-        self.attachments_table = QTableWidget()
-        self.attachments_table.setColumnCount(2)
-        self.attachments_table.setHorizontalHeaderLabels(["📁 File", "📏 Size"])
+        self.attachments_model = AttachmentsTableModel(self)
+        self.attachments_table = QTableView()
+        self.attachments_table.setModel(self.attachments_model)
         self.attachments_table.setAlternatingRowColors(True)
+        self.attachments_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.attachments_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.attachments_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.attachments_table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
         # Make table read-only
-        self.attachments_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.attachments_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.attachments_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.attachments_table.setSelectionBehavior(QTableView.SelectRows)
 
         # Set column widths proportionally - name column gets 70%, size column gets 30%
         header = self.attachments_table.horizontalHeader()
@@ -1620,12 +2159,26 @@ The Team""")
         
         attachments_card.add_content(attachments_content)
         main_layout.addWidget(attachments_card)
+        
+        # Both dropdowns share one menu, so columns are applied once they exist
+        if self.csv_columns:
+            self.update_csv_columns(self.csv_columns)
     
     def update_csv_columns(self, columns):
         """Update available CSV columns for attribute insertion."""
+        # Kept until the page is built so CSV loads don't build it early
         self.csv_columns = columns
-        self.subject_attributes.update_attributes(columns)
-        self.content_attributes.update_attributes(columns)
+        if not self._built:
+            return
+        
+        # One menu serves both dropdowns
+        old_menu = self.attributes_menu
+        self.attributes_menu = ModernAttributeDropdown.build_attributes_menu(columns, self) \
+            if columns else None
+        self.subject_attributes.update_attributes(columns, self.attributes_menu)
+        self.content_attributes.update_attributes(columns, self.attributes_menu)
+        if old_menu is not None:
+            old_menu.deleteLater()
     
     def add_attachment(self):
         """Add file attachments with loading animation."""
@@ -1635,37 +2188,34 @@ The Team""")
             self, "Select Files to Attach", "", "All Files (*)"
         )
         
+        new_attachments = []
         for file_path in file_paths:
-            if file_path and os.path.exists(file_path):
-                row = self.attachments_table.rowCount()
-                self.attachments_table.insertRow(row)
-                
-                file_name = os.path.basename(file_path)
-                file_size = os.path.getsize(file_path)
-                size_str = self.format_file_size(file_size)
-                
-                # Create items with center alignment
-                name_item = QTableWidgetItem(file_name)
-                name_item.setTextAlignment(Qt.AlignCenter)
-                self.attachments_table.setItem(row, 0, name_item)
-                
-                size_item = QTableWidgetItem(size_str)
-                size_item.setTextAlignment(Qt.AlignCenter)
-                self.attachments_table.setItem(row, 1, size_item)
-                
-                # Store full path in item data for later retrieval
-                name_item.setData(Qt.UserRole, file_path)
+            if not file_path:
+                continue
+            # One stat both checks the file exists and gives its size
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
+                continue
+            
+            file_name = os.path.basename(file_path)
+            size_str = self.format_file_size(file_size)
+            
+            # Full path is kept for sending; the table shows name and size
+            new_attachments.append((file_path, file_name, size_str))
+        
+        self.attachments_model.add_attachments(new_attachments)
         
         self.add_btn.stop_loading()
     
     def remove_attachment(self):
         """Remove selected attachment only if user has manually selected a row."""
-        selected_items = self.attachments_table.selectedItems()
-        current_row = self.attachments_table.currentRow()
+        selected_rows = self.attachments_table.selectionModel().selectedRows()
+        current_row = self.attachments_table.currentIndex().row()
         
         # Check if user has actually selected something (not just default selection)
-        if selected_items and current_row >= 0:
-            self.attachments_table.removeRow(current_row)
+        if selected_rows and current_row >= 0:
+            self.attachments_model.remove_attachment(current_row)
         else:
             # Show message if no row is manually selected
             if self.main_window:
@@ -1673,38 +2223,42 @@ The Team""")
     
     def clear_attachments(self):
         """Clear all attachments."""
-        self.attachments_table.setRowCount(0)
+        self.attachments_model.clear()
     
-    def format_file_size(self, size_bytes):
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def format_file_size(size_bytes):
         """Format file size in human-readable format."""
         if size_bytes < 1024:
             return f"{size_bytes} B"
-        elif size_bytes < 1024**2:
-            return f"{size_bytes/1024:.1f} KB"
-        elif size_bytes < 1024**3:
-            return f"{size_bytes/1024**2:.1f} MB"
-        else:
-            return f"{size_bytes/1024**3:.1f} GB"
+        # Each unit is 2**10 of the previous, so the bit length picks it directly
+        units = ComposePage.SIZE_UNITS
+        unit = min((size_bytes.bit_length() - 1) // 10, len(units) - 1)
+        return f"{size_bytes / 1024**unit:.1f} {units[unit]}"
     
     def get_attachments_list(self):
         """Get list of attachment file paths."""
-        attachments = []
-        for row in range(self.attachments_table.rowCount()):
-            item = self.attachments_table.item(row, 0)
-            if item:
-                file_path = item.data(Qt.UserRole)
-                if file_path:
-                    attachments.append(file_path)
-        return attachments
+        return self.attachments_model.file_paths() if self._built else []
+    
+    def attachment_count(self):
+        """Get the number of attachments."""
+        return self.attachments_model.rowCount() if self._built else 0
 
 
-class SendPage(QWidget):
+class SendPage(LazyPage):
     """Modern campaign launch page with improved layout and statistics."""
     
     def __init__(self, main_window):
-        super().__init__()
-        self.main_window = main_window
-        self.setup_ui()
+        super().__init__(main_window)
+        self._stats = (0, 0)
+        self._status = "Ready to launch email campaign"
+        self._last_pct = 0
+        # Progress from the worker is parked here and applied at most ~30 times a second
+        self._pending_progress = None
+        self._last_applied = None
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(33)
+        self._ui_timer.timeout.connect(self._flush_progress)
     
     def setup_ui(self):
         """Setup the modern campaign launch interface."""
@@ -1724,8 +2278,9 @@ class SendPage(QWidget):
         stats_layout.setSpacing(15)
         
         # Create stats cards
-        self.recipients_stats = StatsCard("Total Recipients", "0", "👥", "#3b82f6")
-        self.attachments_stats = StatsCard("Attachments", "0", "📎", "#10b981")
+        recipients_count, attachments_count = self._stats
+        self.recipients_stats = StatsCard("Total Recipients", str(recipients_count), "👥", "#3b82f6")
+        self.attachments_stats = StatsCard("Attachments", str(attachments_count), "📎", "#10b981")
         self.status_stats = StatsCard("Status", "Ready", "📊", "#f59e0b")
         
         stats_layout.addWidget(self.recipients_stats)
@@ -1801,38 +2356,12 @@ class SendPage(QWidget):
         # Enhanced progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 12px;
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #f1f5f9, stop: 1 #e2e8f0);
-                height: 24px;
-                text-align: center;
-                font-weight: bold;
-                color: #1e293b;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                           stop: 0 #3b82f6, stop: 0.5 #60a5fa, stop: 1 #93c5fd);
-                border-radius: 12px;
-                margin: 2px;
-            }
-        """)
+        self.progress_bar.setObjectName("campaignProgress")
         progress_container.addWidget(self.progress_bar)
         
         # Status message with modern styling
-        self.status_label = QLabel("Ready to launch email campaign")
-        self.status_label.setStyleSheet("""
-            font-size: 14px; 
-            color: #6b7280; 
-            font-style: italic;
-            text-align: center;
-            padding: 10px;
-            background: #f8fafc;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-        """)
+        self.status_label = QLabel(self._status)
+        self.status_label.setObjectName("campaignStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
         progress_container.addWidget(self.status_label)
         
@@ -1851,6 +2380,17 @@ class SendPage(QWidget):
         self.results_stats_layout = QHBoxLayout()
         results_layout.addLayout(self.results_stats_layout)
         
+        # Filled in by show_campaign_results after each campaign
+        self.total_stats = StatsCard("Total Sent", "0", "📧", "#3b82f6")
+        self.success_stats = StatsCard("Successful", "0", "✅", "#10b981")
+        self.failed_stats = StatsCard("Failed", "0", "❌", "#ef4444")
+        self.rate_stats = StatsCard("Success Rate", "0%", "📊", "#f59e0b")
+        
+        self.results_stats_layout.addWidget(self.total_stats)
+        self.results_stats_layout.addWidget(self.success_stats)
+        self.results_stats_layout.addWidget(self.failed_stats)
+        self.results_stats_layout.addWidget(self.rate_stats)
+        
         self.results_card.add_content(results_content)
         self.results_card.setVisible(False)
         main_layout.addWidget(self.results_card)
@@ -1877,64 +2417,91 @@ class SendPage(QWidget):
     
     def update_ui_for_sending(self, is_sending):
         """Update UI state during email sending operations."""
+        # An unbuilt page has no sending state to show or reset
+        if not self._built:
+            return
         if is_sending:
             self.send_all_btn.stop_loading()
             self.send_all_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
             self.status_stats.update_value("Sending")
+            self._pending_progress = self._last_applied = None
+            self._ui_timer.start()
         else:
+            self._ui_timer.stop()
             self.send_all_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
+            self.send_all_btn.stop_loading()
             self.test_btn.stop_loading()
             self.status_stats.update_value("Ready")
     
+    def set_status(self, message):
+        """Show a status message, keeping it until the page is built."""
+        self._status = message
+        if self._built:
+            self.status_label.setText(message)
+    
     def update_stats(self, recipients_count=0, attachments_count=0):
         """Update campaign statistics."""
+        # Kept until the page is built so recipient loads don't build it early
+        self._stats = (recipients_count, attachments_count)
+        if not self._built:
+            return
         self.recipients_stats.update_value(str(recipients_count))
         self.attachments_stats.update_value(str(attachments_count))
     
+    def queue_progress(self, current, total):
+        """Record the latest progress; the UI timer applies it on its next tick."""
+        self._pending_progress = (current, total)
+    
+    def _flush_progress(self):
+        """Apply the pending progress if it changed since the last tick."""
+        pending = self._pending_progress
+        if pending is None or pending == self._last_applied:
+            return
+        self._last_applied = pending
+        current, total = pending
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(current)
+        self.update_progress_info(current, total)
+    
     def update_progress_info(self, current, total):
         """Update progress information."""
         if total > 0:
-            percentage = int((current / total) * 100)
-            self.progress_percentage.setText(f"{percentage}%")
+            percentage = current * 100 // total
             self.progress_label.setText(f"Sending emails... {current}/{total}")
         else:
-            self.progress_percentage.setText("0%")
+            percentage = 0
             self.progress_label.setText("Campaign Progress")
+        # The percentage only moves once per 1% of recipients, so skip redundant relabels
+        if percentage != self._last_pct:
+            self._last_pct = percentage
+            self.progress_percentage.setText(f"{percentage}%")
     
     def show_campaign_results(self, results):
         """Show campaign results in the results card."""
-        # Clear previous results
-        for i in reversed(range(self.results_stats_layout.count())):
-            self.results_stats_layout.itemAt(i).widget().setParent(None)
-        
-        # Add new result stats
-        total_stats = StatsCard("Total Sent", str(results.get('total', 0)), "📧", "#3b82f6")
-        success_stats = StatsCard("Successful", str(results.get('sent', 0)), "✅", "#10b981")
-        failed_stats = StatsCard("Failed", str(results.get('failed', 0)), "❌", "#ef4444")
+        total = results.get('total', 0)
+        sent = results.get('sent', 0)
+        success_rate = sent * 100 // total if total > 0 else 0
         
-        success_rate = 0
-        if results.get('total', 0) > 0:
-            success_rate = int((results.get('sent', 0) / results.get('total', 0)) * 100)
-        rate_stats = StatsCard("Success Rate", f"{success_rate}%", "📊", "#f59e0b")
-        
-        self.results_stats_layout.addWidget(total_stats)
-        self.results_stats_layout.addWidget(success_stats)
-        self.results_stats_layout.addWidget(failed_stats)
-        self.results_stats_layout.addWidget(rate_stats)
+        self.total_stats.update_value(str(total))
+        self.success_stats.update_value(str(sent))
+        self.failed_stats.update_value(str(results.get('failed', 0)))
+        self.rate_stats.update_value(f"{success_rate}%")
         
         # Show results card
         self.results_card.setVisible(True)
 
 
-class LogPage(QWidget):
+class LogPage(LazyPage):
     """Activity log page with white font and export functionality."""
     
+    MAX_LOG_ENTRIES = 5000
+    
     def __init__(self, main_window):
-        super().__init__()
-        self.main_window = main_window
-        self.setup_ui()
+        super().__init__(main_window)
+        # Entries logged before the page is first opened
+        self._pending_entries = deque(maxlen=self.MAX_LOG_ENTRIES)
     
     def setup_ui(self):
         """Setup the activity log interface."""
@@ -1971,8 +2538,13 @@ class LogPage(QWidget):
         log_content.setLayout(log_layout)
         
         # Log display with white font for better readability
-        self.log_display = QTextEdit()
+        # Plain-text document appends in constant time and drops the oldest
+        # entries past the block limit, so long campaigns stay responsive
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(self.MAX_LOG_ENTRIES)
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.setCenterOnScroll(False)
         self.log_display.setProperty("class", "log-display")
         self.log_display.setFont(QFont("Consolas", 11))
         
@@ -1980,6 +2552,30 @@ class LogPage(QWidget):
         
         log_card.add_content(log_content)
         main_layout.addWidget(log_card)
+        
+        for entry in self._pending_entries:
+            self.log_display.appendHtml(entry)
+        self._pending_entries.clear()
+    
+    def append_entry(self, html):
+        """Append a formatted entry, holding it until the page is built."""
+        if not self._built:
+            self._pending_entries.append(html)
+            return
+        # Follows new entries while scrolled to the bottom, without pulling
+        # the view away from older entries being read
+        self.log_display.appendHtml(html)
+    
+    def clear_entries(self):
+        """Remove every entry, shown or still pending."""
+        self._pending_entries.clear()
+        if self._built:
+            self.log_display.clear()
+    
+    def to_html(self):
+        """Get the log as an HTML document."""
+        self.ensure_built()
+        return self.log_display.document().toHtml()
     
     def clear_log(self):
         """Clear the activity log."""
@@ -2000,6 +2596,30 @@ class EmailAutomationApp(QMainWindow):
     template personalization, SMTP sending, and activity logging.
     """
     
+    # Sidebar entries (title, tooltip) and top bar titles, in page stack order
+    NAV_ITEMS = (
+        ("⚙️  Setup", "Configure account and upload CSV"),
+        ("👥  Recipients", "Preview recipients and select email column"),
+        ("✏️  Compose", "Write your email content"),
+        ("🚀  Send", "Launch your email campaign"),
+        ("📋  Logs", "View activity logs")
+    )
+    PAGE_TITLES = (
+        "⚙️ Setup Account",
+        "👥 Preview Recipients",
+        "✏️ Compose Email",
+        "🚀 Launch Campaign",
+        "📋 Activity Logs"
+    )
+    
+    # Emoji and color per activity log level
+    LOG_LEVELS = {
+        "INFO": ("ℹ️", "#3b82f6"),
+        "SUCCESS": ("✅", "#10b981"),
+        "ERROR": ("❌", "#ef4444"),
+        "WARNING": ("⚠️", "#f59e0b")
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowIcon(QIcon('icon.png'))
@@ -2013,16 +2633,27 @@ class EmailAutomationApp(QMainWindow):
         self.email_app = None
         self.config = {}
         self.worker = None
+        self.csv_loader = None
+        # (path, mtime_ns, size) of the CSV the current recipients were read from
+        self._csv_stat = None
         self.recipients_data = []
         
         # Setup UI
         self.setup_ui()
         self.setup_menu()
         
-        # Auto-refresh timer for dynamic content updates
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.auto_refresh_content)
-        self.refresh_timer.start(3000)
+        # Reload recipients when the CSV changes on disk instead of polling for it;
+        # the short delay merges the several signals an editor's save can produce
+        self.csv_watcher = QFileSystemWatcher(self)
+        self.csv_reload_timer = QTimer(self)
+        self.csv_reload_timer.setSingleShot(True)
+        self.csv_reload_timer.setInterval(200)
+        self.csv_reload_timer.timeout.connect(self.on_csv_file_changed)
+        self.csv_watcher.fileChanged.connect(lambda path: self.csv_reload_timer.start())
+        # A missing file cannot be watched, so check for it until it reappears
+        self.csv_retry_timer = QTimer(self)
+        self.csv_retry_timer.setInterval(1000)
+        self.csv_retry_timer.timeout.connect(self.on_csv_retry)
         
         # Load default configuration if available
         self.load_config_file('config.json')
@@ -2061,7 +2692,7 @@ class EmailAutomationApp(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll_area.setObjectName("pageScroll")
         
         self.page_stack = QStackedWidget()
         scroll_area.setWidget(self.page_stack)
@@ -2096,15 +2727,7 @@ class EmailAutomationApp(QMainWindow):
         self.nav_list.setObjectName("navList")
         
         # Navigation items with icons and tooltips
-        nav_items = [
-            ("⚙️  Setup", "Configure account and upload CSV"),
-            ("👥  Recipients", "Preview recipients and select email column"),
-            ("✏️  Compose", "Write your email content"),
-            ("🚀  Send", "Launch your email campaign"),
-            ("📋  Logs", "View activity logs")
-        ]
-        
-        for title, tooltip in nav_items:
+        for title, tooltip in self.NAV_ITEMS:
             item = QListWidgetItem(title)
             item.setToolTip(tooltip)
             self.nav_list.addItem(item)
@@ -2117,19 +2740,7 @@ class EmailAutomationApp(QMainWindow):
         # Connection status indicator
         self.connection_indicator = QLabel("🔴 Disconnected")
         self.connection_indicator.setAlignment(Qt.AlignCenter)
-        self.connection_indicator.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                           stop: 0 #64748b, stop: 1 #475569);
-                color: white;
-                border-radius: 12px;
-                padding: 8px;
-                margin: 10px;
-                font-size: 12px;
-                font-weight: bold;
-                border: 1px solid #475569;
-            }
-        """)
+        self.connection_indicator.setProperty("class", "connection-indicator disconnected")
         sidebar_layout.addWidget(self.connection_indicator)
     
     def setup_top_bar(self):
@@ -2150,11 +2761,11 @@ class EmailAutomationApp(QMainWindow):
         
         # Recipients count display
         self.recipients_count = QLabel("👥 Recipients: 0")
-        self.recipients_count.setStyleSheet("color: #64748b; font-weight: bold;")
+        self.recipients_count.setObjectName("recipientsCount")
         top_layout.addWidget(self.recipients_count)
     
     def setup_pages(self):
-        """Setup all application pages."""
+        """Setup all application pages; each one builds its widgets on first use."""
         # Setup page for account and file configuration
         self.setup_page = SetupPage(self)
         self.page_stack.addWidget(self.setup_page)
@@ -2178,24 +2789,6 @@ class EmailAutomationApp(QMainWindow):
     def setup_menu(self):
         """Setup the application menu bar with additional options."""
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: white;
-                color: #1e293b;
-                border-bottom: 1px solid #e2e8f0;
-                padding: 4px;
-            }
-            QMenuBar::item {
-                background: transparent;
-                padding: 8px 12px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QMenuBar::item:selected {
-                background-color: #f1f5f9;
-            }
-        """)
-        
         # File menu
         file_menu = menubar.addMenu('📁 File')
         
@@ -2236,6 +2829,14 @@ class EmailAutomationApp(QMainWindow):
         
         tools_menu.addSeparator()
         
+        # Persisted across sessions; also cleared by the dialog's "Don't ask again"
+        self.confirm_send_action = QAction('✅ Confirm Before Sending', self)
+        self.confirm_send_action.setCheckable(True)
+        self.confirm_send_action.setChecked(QSettings().value("confirm_bulk_send", True, type=bool))
+        self.confirm_send_action.toggled.connect(
+            lambda checked: QSettings().setValue("confirm_bulk_send", checked))
+        tools_menu.addAction(self.confirm_send_action)
+        
         clear_log_action = QAction('🗑️ Clear Activity Log', self)
         clear_log_action.triggered.connect(self.clear_log)
         tools_menu.addAction(clear_log_action)
@@ -2262,59 +2863,30 @@ class EmailAutomationApp(QMainWindow):
         self.page_stack.setCurrentIndex(index)
         
         # Update page title based on current page
-        titles = [
-            "⚙️ Setup Account",
-            "👥 Preview Recipients", 
-            "✏️ Compose Email",
-            "🚀 Launch Campaign",
-            "📋 Activity Logs"
-        ]
-        
-        if 0 <= index < len(titles):
-            self.page_title.setText(titles[index])
+        if 0 <= index < len(self.PAGE_TITLES):
+            self.page_title.setText(self.PAGE_TITLES[index])
         
         # Update send page stats when navigating to it
         if index == 3:  # Send page
             self.update_send_page_stats()
     
-    def update_send_page_stats(self):
-        """Update statistics on the send page."""
-        recipients_count = len(self.recipients_data)
-        attachments_count = self.compose_page.attachments_table.rowCount()
+    def update_send_page_stats(self, recipients_count=None, attachments_count=None):
+        """Update statistics on the send page, looking up any count not given."""
+        if recipients_count is None:
+            recipients_count = len(self.recipients_data)
+        if attachments_count is None:
+            attachments_count = self.compose_page.attachment_count()
         self.send_page.update_stats(recipients_count, attachments_count)
     
     def update_connection_status(self, connected: bool):
         """Update the SMTP connection status indicator."""
         if connected:
             self.connection_indicator.setText("🟢 Connected")
-            self.connection_indicator.setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                               stop: 0 #10b981, stop: 1 #047857);
-                    color: white;
-                    border-radius: 12px;
-                    padding: 8px;
-                    margin: 10px;
-                    font-size: 12px;
-                    font-weight: bold;
-                    border: 1px solid #047857;
-                }
-            """)
+            self.connection_indicator.setProperty("class", "connection-indicator connected")
         else:
             self.connection_indicator.setText("🔴 Disconnected")
-            self.connection_indicator.setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                               stop: 0 #64748b, stop: 1 #475569);
-                    color: white;
-                    border-radius: 12px;
-                    padding: 8px;
-                    margin: 10px;
-                    font-size: 12px;
-                    font-weight: bold;
-                    border: 1px solid #475569;
-                }
-            """)
+            self.connection_indicator.setProperty("class", "connection-indicator disconnected")
+        self.connection_indicator.style().polish(self.connection_indicator)
         
         # Update setup page connection status
         self.setup_page.update_connection_status(connected)
@@ -2324,61 +2896,150 @@ class EmailAutomationApp(QMainWindow):
         self.recipients_count.setText(f"👥 Recipients: {count}")
         # Also update send page if currently viewing it
         if self.page_stack.currentIndex() == 3:
-            self.update_send_page_stats()
+            self.update_send_page_stats(recipients_count=count)
     
     def on_files_changed(self):
         """Handle CSV file changes and refresh data."""
+        # A newly chosen path gets its own missing-file report
+        self.csv_retry_timer.stop()
         self.refresh_recipients()
     
-    def auto_refresh_content(self):
-        """Automatically refresh content when files change."""
-        if hasattr(self.setup_page, 'csv_file_edit'):
-            current_csv = self.setup_page.csv_file_edit.text()
-            
-            if current_csv and os.path.exists(current_csv):
-                # Check if CSV file has changed
-                if (not hasattr(self, '_last_csv') or self._last_csv != current_csv):
-                    self.refresh_recipients()
-                    self._last_csv = current_csv
+    def watch_csv(self, csv_file):
+        """Watch only the given CSV file, or nothing if it is empty."""
+        watched = self.csv_watcher.files()
+        # Editors that save by replacing the file drop it from the watch list,
+        # so this also re-adds the current file after each reload
+        if watched != ([csv_file] if csv_file else []):
+            if watched:
+                self.csv_watcher.removePaths(watched)
+            if csv_file:
+                self.csv_watcher.addPath(csv_file)
+    
+    def on_csv_file_changed(self):
+        """Reload the watched CSV, unless only its attributes changed."""
+        csv_file = self.setup_page.csv_file_path()
+        try:
+            stat = os.stat(csv_file)
+        except OSError:
+            stat = None
+        # The watcher also fires for permission or ownership changes
+        if stat is not None and self._csv_stat == (csv_file, stat.st_mtime_ns, stat.st_size):
+            self.watch_csv(csv_file)
+            return
+        self.refresh_recipients()
+    
+    def on_csv_retry(self):
+        """Reload the CSV once a file that went missing is back."""
+        if os.path.exists(self.setup_page.csv_file_path()):
+            self.refresh_recipients()
     
     def refresh_recipients(self):
         """Refresh recipients data from CSV file."""
+        # Results from a load that is still running are now stale
+        self.csv_loader = None
         try:
-            csv_file = self.setup_page.csv_file_edit.text()
-            if not csv_file or not os.path.exists(csv_file):
+            csv_file = self.setup_page.csv_file_path()
+            if not csv_file:
+                self.csv_retry_timer.stop()
+                self._csv_stat = None
+                self.watch_csv("")
                 # Clear recipients if no file selected
-                self.recipients_page.update_recipients([], "")
-                self.compose_page.update_csv_columns([])
-                self.update_recipients_count(0)
+                self.clear_recipients()
+                return
+            
+            if not os.path.exists(csv_file):
+                self._csv_stat = None
+                # Editors that save by replacing the file remove it for a moment;
+                # keep checking for it, and watch it again once it is back
+                self.watch_csv("")
+                if not self.csv_retry_timer.isActive():
+                    self.csv_retry_timer.start()
+                    self.on_recipients_failed(None, f"CSV file not found: {csv_file}", transient=True)
                 return
             
+            self.csv_retry_timer.stop()
+            
             # Initialize email application if needed
             if not self.email_app:
                 self.email_app = EmailApplication(log_level="INFO")
             
-            # Read recipients from CSV
-            self.recipients_data = self.email_app.csv_reader.read_recipients(csv_file)
-            
-            # Update recipients page
-            self.recipients_page.update_recipients(self.recipients_data, os.path.basename(csv_file))
-            
-            # Update compose page with available columns for attributes
-            if self.recipients_data:
-                columns = list(self.recipients_data[0].keys())
-                self.compose_page.update_csv_columns(columns)
-            else:
-                self.compose_page.update_csv_columns([])
+            self.watch_csv(csv_file)
+            stat = os.stat(csv_file)
+            self._csv_stat = (csv_file, stat.st_mtime_ns, stat.st_size)
             
-            # Update recipient count
-            self.update_recipients_count(len(self.recipients_data))
-            self.log_message(f"✅ Recipients loaded: {len(self.recipients_data)} records", "SUCCESS")
+            # Read recipients from CSV in the background so large files don't freeze the UI
+            loader = CSVLoader(
+                self.email_app.csv_reader, csv_file,
+                self.config.get('files', {}).get('csv_delimiter'),
+                parent=self
+            )
+            loader.loaded.connect(lambda data: self.on_recipients_loaded(loader, data))
+            loader.failed.connect(lambda error, transient: self.on_recipients_failed(loader, error, transient))
+            loader.finished.connect(loader.deleteLater)
+            self.csv_loader = loader
+            self.recipients_count.setText("👥 Recipients: loading...")
+            loader.start()
             
         except Exception as e:
-            # Handle errors gracefully
-            self.recipients_page.update_recipients([], "")
+            self.on_recipients_failed(None, str(e), isinstance(e, CSVLoader.TRANSIENT_ERRORS))
+    
+    def on_recipients_loaded(self, loader, recipients_data):
+        """Show recipients read by a CSVLoader, unless a newer load has started."""
+        if loader is not self.csv_loader:
+            return
+        self.csv_loader = None
+        self.recipients_data = recipients_data
+        
+        # Update recipients page
+        self.recipients_page.update_recipients(self.recipients_data, os.path.basename(loader.csv_file))
+        
+        # Update compose page with available columns for attributes
+        if self.recipients_data:
+            columns = list(self.recipients_data[0].keys())
+            self.compose_page.update_csv_columns(columns)
+        else:
             self.compose_page.update_csv_columns([])
-            self.log_message(f"❌ Error loading recipients: {str(e)}", "ERROR")
-            self.update_recipients_count(0)
+        
+        # Update recipient count
+        self.update_recipients_count(len(self.recipients_data))
+        self.log_message(f"✅ Recipients loaded: {len(self.recipients_data)} records", "SUCCESS")
+    
+    def on_recipients_failed(self, loader, error, transient=False):
+        """Clear recipients after a failed load, unless a newer load has started."""
+        if loader is not self.csv_loader:
+            return
+        self.csv_loader = None
+        # A file caught mid-save keeps the recipients already shown; the watcher
+        # reloads it once the save completes
+        if transient and self.recipients_data:
+            self.update_recipients_count(len(self.recipients_data))
+            self.log_message(f"⚠️ Could not reload recipients, keeping the current list: {error}", "WARNING")
+            return
+        # Handle errors gracefully
+        self.clear_recipients()
+        self.log_message(f"❌ Error loading recipients: {error}", "ERROR")
+    
+    def clear_recipients(self):
+        """Forget the loaded recipients and empty the pages that show them."""
+        self.recipients_data = []
+        self.recipients_page.update_recipients([], "")
+        self.compose_page.update_csv_columns([])
+        self.update_recipients_count(0)
+    
+    def release_worker(self):
+        """Disconnect and schedule deletion of a finished worker before replacing it."""
+        worker = self.worker
+        if worker is None or worker.isRunning():
+            return
+        # Without this every Test click leaves another worker wired to the same slots
+        for signal in (worker.progress_updated, worker.status_updated, worker.emails_sent,
+                       worker.finished, worker.error_occurred):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing was connected to this signal
+        worker.deleteLater()
+        self.worker = None
     
     def test_smtp_connection(self):
         """Test SMTP connection configuration."""
@@ -2401,6 +3062,7 @@ class EmailAutomationApp(QMainWindow):
             self.email_app.config_manager.is_loaded = True
             
             # Start test operation
+            self.release_worker()
             self.worker = EmailWorker(self.email_app, 'test', test_recipient=smtp_config['username'])
             self.worker.status_updated.connect(self.update_status)
             self.worker.finished.connect(self.test_finished)
@@ -2417,10 +3079,11 @@ class EmailAutomationApp(QMainWindow):
                 self.send_page.test_btn.stop_loading()
                 return
             
-            config = self.setup_page.get_config()
-            test_recipient = config['email']['test_email']
+            # validate_configuration just read the form into the app config
+            test_recipient = self.email_app.config['email']['test_email']
             
             # Start test email operation
+            self.release_worker()
             self.worker = EmailWorker(self.email_app, 'test', test_recipient=test_recipient)
             self.worker.status_updated.connect(self.update_status)
             self.worker.finished.connect(self.test_email_finished)
@@ -2444,6 +3107,7 @@ class EmailAutomationApp(QMainWindow):
                 return
             
             # Get email content and settings
+            self.compose_page.ensure_built()
             subject = self.compose_page.subject_edit.text()
             content = self.compose_page.email_content_edit.toPlainText()
             attachments = self.compose_page.get_attachments_list()
@@ -2466,33 +3130,37 @@ class EmailAutomationApp(QMainWindow):
                 self.send_page.send_all_btn.stop_loading()
                 return
             
-            # Update recipients data with selected email column
-            updated_recipients = []
-            for recipient in self.recipients_data:
-                updated_recipient = recipient.copy()
-                updated_recipient['email'] = recipient.get(email_column, '')
-                updated_recipients.append(updated_recipient)
-            
-            # Confirmation dialog
-            reply = QMessageBox.question(
-                self, "Confirm Campaign Launch",
-                f"🚀 Ready to send emails to {len(updated_recipients)} recipients?\n\n"
-                f"📧 Subject: {subject}\n"
-                f"📎 Attachments: {len(attachments)}\n"
-                f"📬 Email Column: {email_column}\n\n"
-                f"This action cannot be undone. Continue?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply != QMessageBox.Yes:
-                self.send_page.send_all_btn.stop_loading()
-                return
+            # Confirmation dialog, unless turned off with "Don't ask again"
+            if self.confirm_send_action.isChecked():
+                confirm_box = QMessageBox(
+                    QMessageBox.Question, "Confirm Campaign Launch",
+                    f"🚀 Ready to send emails to {len(self.recipients_data)} recipients?\n\n"
+                    f"📧 Subject: {subject}\n"
+                    f"📎 Attachments: {len(attachments)}\n"
+                    f"📬 Email Column: {email_column}\n\n"
+                    f"This action cannot be undone. Continue?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    self
+                )
+                confirm_box.setDefaultButton(QMessageBox.No)
+                dont_ask_check = QCheckBox("Don't ask again")
+                confirm_box.setCheckBox(dont_ask_check)
+                
+                if confirm_box.exec_() != QMessageBox.Yes:
+                    self.send_page.send_all_btn.stop_loading()
+                    return
+                
+                # Only a confirmed launch turns the question off
+                if dont_ask_check.isChecked():
+                    self.confirm_send_action.setChecked(False)
             
             # Start bulk email operation
+            self.release_worker()
             self.worker = EmailWorker(
                 self.email_app, 'bulk',
-                recipients_data=updated_recipients,
+                recipients_data=self.recipients_data,
+                email_column=email_column,
+                bcc_batch=self.compose_page.bcc_batch_check.isChecked(),
                 template_content=content,
                 subject=subject,
                 attachments=attachments
@@ -2501,7 +3169,7 @@ class EmailAutomationApp(QMainWindow):
             # Connect worker signals
             self.worker.progress_updated.connect(self.update_progress)
             self.worker.status_updated.connect(self.update_status)
-            self.worker.email_sent.connect(self.email_sent)
+            self.worker.emails_sent.connect(self.emails_sent)
             self.worker.finished.connect(self.bulk_finished)
             self.worker.error_occurred.connect(self.worker_error)
             self.worker.start()
@@ -2549,13 +3217,11 @@ class EmailAutomationApp(QMainWindow):
     
     def update_progress(self, current, total):
         """Update progress bar during bulk email sending."""
-        self.send_page.progress_bar.setMaximum(total)
-        self.send_page.progress_bar.setValue(current)
-        self.send_page.update_progress_info(current, total)
+        self.send_page.queue_progress(current, total)
     
     def update_status(self, message):
         """Update status message during operations."""
-        self.send_page.status_label.setText(message)
+        self.send_page.set_status(message)
         self.log_message(message, "INFO")
     
     def test_finished(self, results):
@@ -2578,7 +3244,7 @@ class EmailAutomationApp(QMainWindow):
             self.show_error("🧪 Test Email Failed", f"❌ Test email failed: {results.get('message', 'Unknown error')}\n\nPlease check your settings.")
         
         self.send_page.test_btn.stop_loading()
-        self.send_page.status_label.setText("Ready to launch campaign")
+        self.send_page.set_status("Ready to launch campaign")
     
     def bulk_finished(self, results):
         """Handle bulk email campaign completion."""
@@ -2600,6 +3266,10 @@ class EmailAutomationApp(QMainWindow):
         message += f"❌ Failed: {results['failed']}\n"
         message += f"📈 Success Rate: {success_rate}%"
         
+        if results.get('aborted'):
+            message += ("\n\n⛔ The campaign was stopped early because too many sends were failing. "
+                        "Check your SMTP credentials and your provider's sending limits.")
+        
         # Add error information if any
         if results['errors']:
             message += f"\n\n⚠️ Errors occurred:"
@@ -2614,136 +3284,74 @@ class EmailAutomationApp(QMainWindow):
         else:
             self.show_warning("⚠️ Campaign Complete with Issues", message)
         
-        self.send_page.status_label.setText("Campaign completed successfully")
+        if results.get('aborted'):
+            self.send_page.set_status("Campaign aborted after repeated failures")
+            self.log_message("⛔ Email campaign aborted: too many delivery failures", "ERROR")
+        else:
+            self.send_page.set_status("Campaign completed successfully")
         self.log_message(f"📊 Email campaign completed: {results['sent']}/{results['total']} sent successfully", "INFO")
     
-    def email_sent(self, recipient, success, error):
-        """Handle individual email send results."""
-        if success:
-            self.log_message(f"✅ Email sent to {recipient}", "SUCCESS")
-        else:
-            self.log_message(f"❌ Failed to send to {recipient}: {error}", "ERROR")
+    def emails_sent(self, batch):
+        """Log a batch of (recipient, success, error) send results in one append."""
+        self.log_messages(
+            (f"✅ Email sent to {recipient}", "SUCCESS") if success
+            else (f"❌ Failed to send to {recipient}: {error}", "ERROR")
+            for recipient, success, error in batch
+        )
     
     def worker_error(self, error):
         """Handle worker thread errors."""
-        self.show_error("⚠️ Operation Error", f"An error occurred during the operation:\n\n{error}")
-        self.send_page.status_label.setText("Ready to launch campaign")
+        # Reset the UI before the modal dialog so it isn't left mid-operation behind it;
+        # update_ui_for_sending also stops both buttons, and update_connection_status
+        # also updates the setup page indicator
+        self.send_page.set_status("Ready to launch campaign")
         self.send_page.update_ui_for_sending(False)
-        self.send_page.test_btn.stop_loading()
-        self.send_page.send_all_btn.stop_loading()
-        self.setup_page.update_connection_status(False, "Operation failed")
         self.update_connection_status(False)
+        self.show_error("⚠️ Operation Error", f"An error occurred during the operation:\n\n{error}")
     
-    def log_message(self, message, level="INFO"):
-        """Add message to activity log with formatting and white font."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Define level styling
-        level_info = {
-            "INFO": ("ℹ️", "#3b82f6"),
-            "SUCCESS": ("✅", "#10b981"),
-            "ERROR": ("❌", "#ef4444"),
-            "WARNING": ("⚠️", "#f59e0b")
-        }
-        
-        emoji, color = level_info.get(level, ("📝", "#64748b"))
-        
-        # Create HTML-formatted message with white font
-        formatted_message = f'''
-        <div style="margin: 5px 0; padding: 8px; border-left: 3px solid {color}; background: rgba(59, 130, 246, 0.05);">
-            <span style="color: {color}; font-weight: bold;">[{timestamp}] {emoji} {level}:</span>
-            <span style="color: #ffffff; margin-left: 10px;">{message}</span>
-        </div>
-        '''
-        
-        self.log_page.log_display.append(formatted_message)
+    def format_log_entry(self, message, level, timestamp):
+        """Format one activity log entry as HTML with white font."""
+        emoji, color = self.LOG_LEVELS.get(level, ("📝", "#64748b"))
         
-        # Auto-scroll to bottom
-        scrollbar = self.log_page.log_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # One line per entry; the plain-text log lays out character colors
+        # and weight but not block borders, margins or backgrounds
+        return (f'<p><span style="color: {color}; font-weight: bold;">[{timestamp}] {emoji} {level}:</span> '
+                f'<span style="color: #ffffff;">{message}</span></p>')
     
-    def show_error(self, title, message):
-        """Show error message dialog with modern styling."""
+    def log_message(self, message, level="INFO"):
+        """Add message to activity log with formatting and white font."""
+        timestamp = time.strftime("%H:%M:%S")
+        self.log_page.append_entry(self.format_log_entry(message, level, timestamp))
+    
+    def log_messages(self, entries):
+        """Add several (message, level) entries to the activity log in one append."""
+        timestamp = time.strftime("%H:%M:%S")
+        html = "".join(self.format_log_entry(message, level, timestamp) for message, level in entries)
+        if html:
+            self.log_page.append_entry(html)
+    
+    def show_message(self, icon, tone, title, message):
+        """Show a message dialog styled by the dialog-<tone> rules in MODERN_STYLESHEET."""
         msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Critical)
+        msg_box.setIcon(icon)
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-                border-radius: 8px;
-                min-width: 350px;
-            }
-            QMessageBox QPushButton {
-                background-color: #ef4444;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 70px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #dc2626;
-            }
-        """)
+        msg_box.setProperty("class", f"dialog dialog-{tone}")
         msg_box.exec_()
+    
+    def show_error(self, title, message):
+        """Show error message dialog with modern styling."""
+        self.show_message(QMessageBox.Critical, "error", title, message)
         self.log_message(f"❌ {message}", "ERROR")
     
     def show_info(self, title, message):
         """Show information message dialog with modern styling."""
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Information)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-                border-radius: 8px;
-                min-width: 350px;
-            }
-            QMessageBox QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 70px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
-        msg_box.exec_()
+        self.show_message(QMessageBox.Information, "info", title, message)
         self.log_message(f"ℹ️ {message}", "INFO")
     
     def show_warning(self, title, message):
         """Show warning message dialog with modern styling."""
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Warning)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-                border-radius: 8px;
-                min-width: 350px;
-            }
-            QMessageBox QPushButton {
-                background-color: #f59e0b;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 70px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #d97706;
-            }
-        """)
-        msg_box.exec_()
+        self.show_message(QMessageBox.Warning, "warning", title, message)
         self.log_message(f"⚠️ {message}", "WARNING")
     
     def load_config(self):
@@ -2759,8 +3367,9 @@ class EmailAutomationApp(QMainWindow):
         """Load configuration from specified file."""
         try:
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(file_path, 'rb') as f:
+                    raw_config = f.read()
+                config = orjson.loads(raw_config) if ORJSON_AVAILABLE else json.loads(raw_config.decode('utf-8'))
                 
                 # Apply configuration to UI
                 self.setup_page.set_config(config)
@@ -2794,8 +3403,12 @@ class EmailAutomationApp(QMainWindow):
                     'application': 'Email Automation'
                 }
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
+                if ORJSON_AVAILABLE:
+                    with open(file_path, 'wb') as f:
+                        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(config, f, indent=2, ensure_ascii=False)
                 
                 self.show_info("💾 Configuration Saved", 
                               f"Configuration successfully saved to:\n{os.path.basename(file_path)}")
@@ -2814,7 +3427,7 @@ class EmailAutomationApp(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.log_page.log_display.clear()
+            self.log_page.clear_entries()
             self.log_message("🗑️ Activity log cleared by user", "INFO")
     
     def save_log(self):
@@ -2883,7 +3496,7 @@ class EmailAutomationApp(QMainWindow):
         </div>
     </div>
     <div class="log-content">
-        {self.log_page.log_display.toHtml()}
+        {self.log_page.to_html()}
     </div>
     <div class="footer">
         Email Automation v1.0.0 | Created by ByeBye21 | © 2025 All rights reserved<br>
@@ -2894,15 +3507,22 @@ class EmailAutomationApp(QMainWindow):
 </html>
                 """
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                self.show_info("💾 Log Exported", f"Activity log exported to:\n{os.path.basename(file_path)}")
-                self.log_message(f"Activity log exported to {file_path}", "SUCCESS")
+                # The document was read above on the UI thread; only the write moves off it
+                writer = FileWriter(file_path, html_content, parent=self)
+                writer.saved.connect(self.log_exported)
+                writer.failed.connect(
+                    lambda error: self.show_error("❌ Export Error", f"Failed to export log:\n\n{error}"))
+                writer.finished.connect(writer.deleteLater)
+                writer.start()
                 
             except Exception as e:
                 self.show_error("❌ Export Error", f"Failed to export log:\n\n{str(e)}")
     
+    def log_exported(self, file_path):
+        """Confirm a finished log export."""
+        self.show_info("💾 Log Exported", f"Activity log exported to:\n{os.path.basename(file_path)}")
+        self.log_message(f"Activity log exported to {file_path}", "SUCCESS")
+    
     def show_about(self):
         """Show comprehensive about dialog."""
         about_text = """
@@ -2953,26 +3573,7 @@ class EmailAutomationApp(QMainWindow):
         about_dialog = QMessageBox(self)
         about_dialog.setWindowTitle("About Email Automation")
         about_dialog.setText(about_text)
-        about_dialog.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-                border-radius: 12px;
-                min-width: 600px;
-                min-height: 500px;
-            }
-            QMessageBox QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
+        about_dialog.setProperty("class", "dialog dialog-info dialog-about")
         about_dialog.exec_()
     
     def closeEvent(self, event):
@@ -2993,23 +3594,9 @@ class EmailAutomationApp(QMainWindow):
             else:
                 event.ignore()
         else:
-            # Save window geometry for next session
-            try:
-                settings = {
-                    'geometry': {
-                        'x': self.x(),
-                        'y': self.y(),
-                        'width': self.width(),
-                        'height': self.height()
-                    },
-                    'last_saved': datetime.now().isoformat()
-                }
-                
-                with open('app_settings.json', 'w', encoding='utf-8') as f:
-                    json.dump(settings, f, indent=2)
-                    
-            except Exception:
-                pass  # Ignore settings save errors
+            # Save window geometry for next session; QSettings is keyed by the
+            # organization and application names set in main()
+            QSettings().setValue("geometry", self.saveGeometry())
             
             event.accept()
 
@@ -3042,22 +3629,9 @@ def main():
     window = EmailAutomationApp()
     
     # Restore window geometry if available
-    try:
-        with open('app_settings.json', 'r', encoding='utf-8') as f:
-            settings = json.load(f)
-        
-        geometry = settings.get('geometry', {})
-        if geometry:
-            window.resize(
-                geometry.get('width', 1400),
-                geometry.get('height', 900)
-            )
-            window.move(
-                geometry.get('x', 100),
-                geometry.get('y', 100)
-            )
-    except Exception:
-        pass  # Use default geometry if settings not found
+    geometry = QSettings().value("geometry")
+    if geometry:
+        window.restoreGeometry(geometry)
     
     # Show window
     window.show()